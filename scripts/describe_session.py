@@ -17,18 +17,46 @@ from collections import Counter
 AEST = timezone(timedelta(hours=10))
 
 
+# Embedded iOS metrics summarised per field (alongside the "mode" label)
+METRIC_KEYS = ("ent", "coh", "br", "vol", "amp", "modeConf")
+
+
 def load(path: Path):
-    header, footer, samples = None, None, []
-    for line in path.read_text().strip().split("\n"):
-        rec = json.loads(line)
-        t = rec.get("type")
-        if t == "session_start":
-            header = rec
-        elif t == "session_end":
-            footer = rec
-        else:
-            samples.append(rec)
-    return header, footer, samples
+    """Read a session into header, footer, sample count and field columns.
+
+    Samples are not kept as dicts: each field goes into its own flat list as
+    the file streams. Metric columns ("mode" and METRIC_KEYS) are
+    index-aligned across samples that carry metrics, with None where a key is
+    missing, so slices line up across columns.
+    """
+    header, footer, n_samples = None, None, 0
+    cols = {"rr": [], "hr": [], "mode": [], **{k: [] for k in METRIC_KEYS}}
+    with path.open() as f:
+        for line in f:
+            if not line.strip():
+                continue
+            rec = json.loads(line)
+            t = rec.get("type")
+            if t == "session_start":
+                header = rec
+            elif t == "session_end":
+                footer = rec
+            else:
+                n_samples += 1
+                cols["rr"].extend([int(x) for x in rec.get("rr", [])])
+                if "hr" in rec:
+                    cols["hr"].append(rec["hr"])
+                if "metrics" in rec:
+                    m = rec["metrics"]
+                    cols["mode"].append(m.get("mode"))
+                    for k in METRIC_KEYS:
+                        cols[k].append(m.get(k))
+    return header, footer, n_samples, cols
+
+
+def present(values):
+    """Drop the None placeholders from a metric column."""
+    return [v for v in values if v is not None]
 
 
 def rmssd(rr_ms):
@@ -54,7 +82,7 @@ def pnn50(rr_ms):
 
 
 def describe(path: Path):
-    header, footer, samples = load(path)
+    header, footer, n_samples, cols = load(path)
 
     print(f"Session: {path.name}")
     print("=" * 64)
@@ -79,24 +107,12 @@ def describe(path: Path):
     if duration_sec:
         m, s = divmod(duration_sec, 60)
         print(f"Duration:       {duration_sec}s  ({m}m {s}s)")
-    print(f"Samples:        {len(samples)}  (reported {sample_count_reported})")
+    print(f"Samples:        {n_samples}  (reported {sample_count_reported})")
     print()
 
-    # --- Collect all RR intervals flattened, and per-sample metrics ---
-    all_rr = []
-    hrs = []
-    metrics_samples = []  # list of dicts with ent/coh/br/vol/amp/modeConf/mode
-    sample_times = []
-
-    for s in samples:
-        rr = s.get("rr", [])
-        all_rr.extend([int(x) for x in rr])
-        if "hr" in s:
-            hrs.append(s["hr"])
-        if "metrics" in s:
-            metrics_samples.append(s["metrics"])
-        if "ts" in s:
-            sample_times.append(s["ts"])
+    all_rr = cols["rr"]
+    hrs = cols["hr"]
+    n_metrics = len(cols["mode"])  # samples carrying embedded metrics
 
     # --- HR summary ---
     print("Heart Rate")
@@ -121,9 +137,9 @@ def describe(path: Path):
     print()
 
     # --- Embedded metrics summary ---
-    if metrics_samples:
+    if n_metrics:
         def stat(key):
-            vals = [m[key] for m in metrics_samples if key in m and m[key] is not None]
+            vals = present(cols[key])
             if not vals:
                 return None
             return {
@@ -154,7 +170,7 @@ def describe(path: Path):
         # --- Mode distribution ---
         print("Mode Distribution  (primary label per sample)")
         print("-" * 64)
-        modes = [m.get("mode") for m in metrics_samples if m.get("mode")]
+        modes = [m for m in cols["mode"] if m]
         counts = Counter(modes)
         total = sum(counts.values())
         canonical = [
@@ -205,16 +221,15 @@ def describe(path: Path):
         # --- Timeline quartiles (how did the session evolve?) ---
         print("Session Evolution  (quartiles by sample index)")
         print("-" * 64)
-        q = len(metrics_samples) // 4
+        q = n_metrics // 4
         for i, label in enumerate(["Q1 first quarter", "Q2 second quarter", "Q3 third quarter", "Q4 last quarter"]):
             lo = i * q
-            hi = (i + 1) * q if i < 3 else len(metrics_samples)
-            slice_ = metrics_samples[lo:hi]
-            ent = [m["ent"] for m in slice_ if "ent" in m]
-            coh = [m["coh"] for m in slice_ if "coh" in m]
-            br = [m["br"] for m in slice_ if "br" in m]
-            vol = [m["vol"] for m in slice_ if "vol" in m]
-            modes_q = Counter(m.get("mode") for m in slice_ if m.get("mode"))
+            hi = (i + 1) * q if i < 3 else n_metrics
+            ent = present(cols["ent"][lo:hi])
+            coh = present(cols["coh"][lo:hi])
+            br = present(cols["br"][lo:hi])
+            vol = present(cols["vol"][lo:hi])
+            modes_q = Counter(m for m in cols["mode"][lo:hi] if m)
             top_mode, top_count = modes_q.most_common(1)[0] if modes_q else ("?", 0)
             top_pct = 100.0 * top_count / sum(modes_q.values()) if modes_q else 0
             print(f"  {label}")
@@ -224,7 +239,7 @@ def describe(path: Path):
         print()
 
         # --- modeConf / ambiguity check ---
-        confs = [m["modeConf"] for m in metrics_samples if "modeConf" in m]
+        confs = present(cols["modeConf"])
         if confs:
             print("Mode Confidence Profile")
             print("-" * 64)
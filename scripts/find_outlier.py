@@ -11,12 +11,15 @@ AEST = timezone(timedelta(hours=10))
 def main(path: Path, top_n: int = 5, window: int = 3):
     samples = []
     start_ts = None
-    for line in path.read_text().strip().split("\n"):
-        rec = json.loads(line)
-        if rec.get("type") == "session_start":
-            start_ts = datetime.fromisoformat(rec["ts"].replace("Z", "+00:00"))
-        elif "metrics" in rec and "amp" in rec.get("metrics", {}):
-            samples.append(rec)
+    with path.open() as f:
+        for line in f:
+            if not line.strip():
+                continue
+            rec = json.loads(line)
+            if rec.get("type") == "session_start":
+                start_ts = datetime.fromisoformat(rec["ts"].replace("Z", "+00:00"))
+            elif "metrics" in rec and "amp" in rec.get("metrics", {}):
+                samples.append(rec)
 
     # Rank by amp
     ranked = sorted(
@@ -48,15 +48,18 @@ def parse_ts(s: str) -> datetime:
 
 def load_ebs(path: Path):
     header, footer, samples = None, None, []
-    for line in path.read_text().strip().split("\n"):
-        rec = json.loads(line)
-        t = rec.get("type")
-        if t == "session_start":
-            header = rec
-        elif t == "session_end":
-            footer = rec
-        else:
-            samples.append(rec)
+    with path.open() as f:
+        for line in f:
+            if not line.strip():
+                continue
+            rec = json.loads(line)
+            t = rec.get("type")
+            if t == "session_start":
+                header = rec
+            elif t == "session_end":
+                footer = rec
+            else:
+                samples.append(rec)
     return header, footer, samples
 
 
@@ -72,28 +75,29 @@ def load_mode_history(path: Path):
     skipped = 0
     if not path.exists():
         return events
-    for line in path.read_text().strip().split("\n"):
-        if not line.strip():
-            continue
-        rec = json.loads(line)
-        ts_raw = rec.get("timestamp")
-        iso = rec.get("iso")
-        ts = None
-        if isinstance(ts_raw, str):
-            try:
-                ts = parse_ts(ts_raw)
-            except Exception:
-                pass
-        if ts is None and isinstance(iso, str):
-            try:
-                ts = parse_ts(iso)
-            except Exception:
-                pass
-        if ts is None or "from_mode" not in rec or "to_mode" not in rec:
-            skipped += 1
-            continue
-        rec["_ts"] = ts
-        events.append(rec)
+    with path.open() as f:
+        for line in f:
+            if not line.strip():
+                continue
+            rec = json.loads(line)
+            ts_raw = rec.get("timestamp")
+            iso = rec.get("iso")
+            ts = None
+            if isinstance(ts_raw, str):
+                try:
+                    ts = parse_ts(ts_raw)
+                except Exception:
+                    pass
+            if ts is None and isinstance(iso, str):
+                try:
+                    ts = parse_ts(iso)
+                except Exception:
+                    pass
+            if ts is None or "from_mode" not in rec or "to_mode" not in rec:
+                skipped += 1
+                continue
+            rec["_ts"] = ts
+            events.append(rec)
     events.sort(key=lambda e: e["_ts"])
     if skipped:
         print(f"(skipped {skipped} mode-history entries with legacy/incomplete schema)")
@@ -13,7 +13,7 @@ Output:
     sessions/ios-exports/2025-12-29_101121_processed.jsonl
 """
 
-import json
+import itertools
 import sys
 from pathlib import Path
 from collections import deque
@@ -21,8 +21,12 @@ from collections import deque
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
-from processing.hrv import compute_hrv_metrics
+from processing.hrv import HRVMetrics, compute_hrv_metrics
 from processing.phase import PhaseTrajectory
+from utils import json_codec
+
+# Encoded lines are joined and written this many at a time
+WRITE_BATCH = 64
 
 
 def process_session(input_path: Path) -> Path:
@@ -31,175 +35,207 @@ def process_session(input_path: Path) -> Path:
     print(f"Processing: {input_path}")
     print("=" * 50)
 
-    # Read all records
-    lines = input_path.read_text().strip().split('\n')
-    records = [json.loads(line) for line in lines]
-
-    # Find header and footer
-    header = None
-    footer = None
-    data_records = []
-
-    for record in records:
-        if record.get('type') == 'session_start':
-            header = record
-        elif record.get('type') == 'session_end':
-            footer = record
-        elif 'hr' in record and 'rr' in record:
-            data_records.append(record)
-
-    if not header:
-        # Create synthetic header for legacy files
-        header = {
-            'type': 'session_start',
-            'ts': data_records[0]['ts'] if data_records else '',
-            'schema_version': '1.1.0',
-            'source': 'unknown'
-        }
-
-    print(f"Source: {header.get('source', 'unknown')}")
-    print(f"Schema: {header.get('schema_version', 'unknown')}")
-    print(f"Raw records: {len(data_records)}")
+    output_path = input_path.with_name(
+        input_path.stem + '_processed' + input_path.suffix
+    )
 
     # Initialize processing state
     rr_buffer: deque[int] = deque(maxlen=30)
     trajectory = PhaseTrajectory(window_size=30)
-    processed_records = []
+    metrics: HRVMetrics | None = None
+    raw_count = 0
     record_count = 0
 
-    for record in data_records:
-        ts_str = record.get('ts')
-        hr = record.get('hr')
-        rr_list = record.get('rr', [])
+    # Summary stats, accumulated as we stream (no record list is kept)
+    rr_total = 0
+    rr_min: int | None = None
+    rr_max: int | None = None
+    last_processed: dict | None = None
+
+    # Stream line-by-line: session_start is first and session_end last by
+    # JSONL convention, so the header can be peeked and the footer written
+    # when it arrives. Steady-state memory is one record plus rr_buffer.
+    with open(input_path) as fin, open(output_path, 'w') as fout:
+        first_line = fin.readline()
+        while first_line and not first_line.strip():
+            first_line = fin.readline()
+        first = json_codec.loads(first_line) if first_line else None
+
+        pending: list[dict] = []
+        if first is not None and first.get('type') == 'session_start':
+            header = first
+        else:
+            # Create synthetic header for legacy files
+            header = {
+                'type': 'session_start',
+                'ts': first.get('ts', '') if first else '',
+                'schema_version': '1.1.0',
+                'source': 'unknown'
+            }
+            if first is not None:
+                pending.append(first)
 
-        # Add valid RR intervals to buffer
-        for rr in rr_list:
-            if 300 < rr < 1500:  # Filter physiologically valid range
-                rr_buffer.append(rr)
+        print(f"Source: {header.get('source', 'unknown')}")
+        print(f"Schema: {header.get('schema_version', 'unknown')}")
 
-        # Need minimum data to compute meaningful metrics
-        if len(rr_buffer) < 6:
-            # Output raw record with placeholder metrics
+        # Build output header
+        output_header = {
+            'type': 'session_start',
+            'ts': header.get('ts', ''),
+            'schema_version': '1.1.0',
+            'source': header.get('source', 'unknown'),
+            'device_id': header.get('device_id'),
+            'processed': True,
+            'note': 'ent=entrainment (breath-heart sync), coherence=trajectory integrity'
+        }
+        fout.write(json_codec.dumps(output_header) + '\n')
+
+        footer = None
+        batch: list[str] = []
+        remaining = (json_codec.loads(line) for line in fin if line.strip())
+
+        for record in itertools.chain(pending, remaining):
+            rtype = record.get('type')
+            if rtype == 'session_end':
+                footer = record
+                continue
+            if rtype == 'session_start' or 'hr' not in record or 'rr' not in record:
+                continue
+
+            # hr/rr presence was just checked, so subscript directly; ts stays
+            # optional (legacy captures may omit it). A null rr counts as empty.
+            raw_count += 1
+            ts_str = record.get('ts')
+            hr = record['hr']
+            rr_list = record['rr'] or []
+
+            # Add valid RR intervals to buffer; the same pass feeds the
+            # summary range (over all RR, valid or not)
+            buffer_changed = False
+            for rr in rr_list:
+                rr_total += 1
+                if rr_min is None or rr < rr_min:
+                    rr_min = rr
+                if rr_max is None or rr > rr_max:
+                    rr_max = rr
+                if 300 < rr < 1500:  # Filter physiologically valid range
+                    rr_buffer.append(rr)
+                    buffer_changed = True
+
+            # Need minimum data to compute meaningful metrics
+            if len(rr_buffer) < 6:
+                # Output raw record with placeholder metrics
+                processed = {
+                    'ts': ts_str,
+                    'hr': hr,
+                    'rr': rr_list,
+                    'metrics': {
+                        'amp': 0,
+                        'ent': 0.0,
+                        'ent_label': '[insufficient data]',
+                        'breath': None,
+                        'volatility': 0.0,
+                        'mode': 'unknown',
+                        'mode_score': 0.0
+                    },
+                    'phase': {
+                        'position': [0.0, 0.5, 0.0],
+                        'velocity': [0.0, 0.0, 0.0],
+                        'velocity_mag': 0.0,
+                        'curvature': 0.0,
+                        'stability': 0.5,
+                        'history_signature': 0.0,
+                        'phase_label': 'warming up',
+                        'coherence': 0.0,
+                        'movement_annotation': 'insufficient data',
+                        'movement_aware_label': 'unknown'
+                    }
+                }
+                batch.append(json_codec.dumps(processed) + '\n')
+                if len(batch) >= WRITE_BATCH:
+                    fout.write(''.join(batch))
+                    batch.clear()
+                last_processed = processed
+                continue
+
+            record_count += 1
+
+            # Compute HRV metrics from buffer. Metrics are a pure function of
+            # the buffer, so a record that brought no valid RR reuses the last
+            # result instead of re-copying and re-walking an unchanged window.
+            if buffer_changed or metrics is None:
+                metrics = compute_hrv_metrics(list(rr_buffer))
+
+            # Update trajectory and get dynamics
+            # Use record count as pseudo-timestamp to avoid datetime issues
+            dynamics = trajectory.append(metrics, float(record_count))
+
+            # Compute trajectory coherence
+            coherence = trajectory.compute_trajectory_coherence(lag=5)
+
+            # Build processed record. append() always returns dynamics, so
+            # fields are read directly rather than guarded per field.
+            px, py, pz = dynamics.position
+            vx, vy, vz = dynamics.velocity
             processed = {
                 'ts': ts_str,
                 'hr': hr,
                 'rr': rr_list,
                 'metrics': {
-                    'amp': 0,
-                    'ent': 0.0,
-                    'ent_label': '[insufficient data]',
-                    'breath': None,
-                    'volatility': 0.0,
-                    'mode': 'unknown',
-                    'mode_score': 0.0
+                    'amp': metrics.amplitude,
+                    'ent': round(metrics.entrainment, 4),
+                    'ent_label': metrics.entrainment_label,
+                    'breath': round(metrics.breath_rate, 1) if metrics.breath_rate else None,
+                    'volatility': round(metrics.rr_volatility, 4),
+                    'mode': metrics.mode_label,
+                    'mode_score': round(metrics.mode_score, 3)
                 },
                 'phase': {
-                    'position': [0.0, 0.5, 0.0],
-                    'velocity': [0.0, 0.0, 0.0],
-                    'velocity_mag': 0.0,
-                    'curvature': 0.0,
-                    'stability': 0.5,
-                    'history_signature': 0.0,
-                    'phase_label': 'warming up',
-                    'coherence': 0.0,
-                    'movement_annotation': 'insufficient data',
-                    'movement_aware_label': 'unknown'
+                    'position': [round(px, 4), round(py, 4), round(pz, 4)],
+                    'velocity': [round(vx, 4), round(vy, 4), round(vz, 4)],
+                    'velocity_mag': round(dynamics.velocity_magnitude, 4),
+                    'curvature': round(dynamics.curvature, 4),
+                    'stability': round(dynamics.stability, 4),
+                    'history_signature': round(dynamics.history_signature, 4),
+                    'phase_label': dynamics.phase_label,
+                    'coherence': round(coherence, 4),
+                    'movement_annotation': dynamics.movement_annotation,
+                    'movement_aware_label': dynamics.movement_aware_label
                 }
             }
-            processed_records.append(processed)
-            continue
-
-        record_count += 1
-
-        # Compute HRV metrics from buffer
-        rr_as_list = list(rr_buffer)
-        metrics = compute_hrv_metrics(rr_as_list)
-
-        # Update trajectory and get dynamics
-        # Use record count as pseudo-timestamp to avoid datetime issues
-        dynamics = trajectory.append(metrics, float(record_count))
-
-        # Compute trajectory coherence
-        coherence = trajectory.compute_trajectory_coherence(lag=5)
-
-        # Build processed record
-        processed = {
-            'ts': ts_str,
-            'hr': hr,
-            'rr': rr_list,
-            'metrics': {
-                'amp': metrics.amplitude,
-                'ent': round(metrics.entrainment, 4),
-                'ent_label': metrics.entrainment_label,
-                'breath': round(metrics.breath_rate, 1) if metrics.breath_rate else None,
-                'volatility': round(metrics.rr_volatility, 4),
-                'mode': metrics.mode_label,
-                'mode_score': round(metrics.mode_score, 3)
-            },
-            'phase': {
-                'position': [round(p, 4) for p in dynamics.position] if dynamics else [0, 0.5, 0],
-                'velocity': [round(v, 4) for v in dynamics.velocity] if dynamics else [0, 0, 0],
-                'velocity_mag': round(dynamics.velocity_magnitude, 4) if dynamics else 0.0,
-                'curvature': round(dynamics.curvature, 4) if dynamics else 0.0,
-                'stability': round(dynamics.stability, 4) if dynamics else 0.5,
-                'history_signature': round(dynamics.history_signature, 4) if dynamics else 0.0,
-                'phase_label': dynamics.phase_label if dynamics else 'warming up',
-                'coherence': round(coherence, 4),
-                'movement_annotation': dynamics.movement_annotation if dynamics else 'unknown',
-                'movement_aware_label': dynamics.movement_aware_label if dynamics else 'unknown'
-            }
-        }
-
-        # Add soft mode if available
-        if dynamics and dynamics.soft_mode:
-            processed['phase']['soft_mode'] = {
-                'primary': dynamics.soft_mode.primary_mode,
-                'secondary': dynamics.soft_mode.secondary_mode,
-                'ambiguity': round(dynamics.soft_mode.ambiguity, 4),
-                'membership': {k: round(v, 4) for k, v in dynamics.soft_mode.membership.items()}
-            }
-
-        processed_records.append(processed)
 
-    print(f"Processed records: {record_count}")
+            # Add soft mode if available
+            if dynamics.soft_mode:
+                processed['phase']['soft_mode'] = {
+                    'primary': dynamics.soft_mode.primary_mode,
+                    'secondary': dynamics.soft_mode.secondary_mode,
+                    'ambiguity': round(dynamics.soft_mode.ambiguity, 4),
+                    'membership': {k: round(v, 4) for k, v in dynamics.soft_mode.membership.items()}
+                }
 
-    # Build output header
-    output_header = {
-        'type': 'session_start',
-        'ts': header.get('ts', ''),
-        'schema_version': '1.1.0',
-        'source': header.get('source', 'unknown'),
-        'device_id': header.get('device_id'),
-        'processed': True,
-        'note': 'ent=entrainment (breath-heart sync), coherence=trajectory integrity'
-    }
-
-    # Write output
-    output_path = input_path.with_name(
-        input_path.stem + '_processed' + input_path.suffix
-    )
+            batch.append(json_codec.dumps(processed) + '\n')
+            if len(batch) >= WRITE_BATCH:
+                fout.write(''.join(batch))
+                batch.clear()
+            last_processed = processed
 
-    with open(output_path, 'w') as f:
-        f.write(json.dumps(output_header) + '\n')
-        for record in processed_records:
-            f.write(json.dumps(record) + '\n')
         if footer:
-            f.write(json.dumps(footer) + '\n')
+            batch.append(json_codec.dumps(footer) + '\n')
+        fout.write(''.join(batch))
 
+    print(f"Raw records: {raw_count}")
+    print(f"Processed records: {record_count}")
     print(f"Output: {output_path}")
     print("=" * 50)
 
     # Summary stats
-    if processed_records:
-        all_rr = []
-        for r in processed_records:
-            all_rr.extend(r.get('rr', []))
-        if all_rr:
-            print(f"RR intervals: {len(all_rr)}")
-            print(f"RR range: {min(all_rr)} - {max(all_rr)} ms")
+    if last_processed:
+        if rr_total:
+            print(f"RR intervals: {rr_total}")
+            print(f"RR range: {rr_min} - {rr_max} ms")
 
         # Final metrics from last record
-        last = processed_records[-1]
+        last = last_processed
         print(f"Final mode: {last['metrics']['mode']} ({last['metrics']['mode_score']:.2f})")
         print(f"Final coherence: {last['phase']['coherence']:.3f}")
 
@@ -14,6 +14,7 @@ from datetime import datetime
 from typing import Callable, Any
 
 from domain.types import SemioticMarker, FieldEvent
+from utils import json_codec
 
 
 class WebSocketServer:
@@ -22,6 +23,12 @@ class WebSocketServer:
     Port 8765 chosen to avoid conflicts with common dev servers.
     """
 
+    # Outgoing frames buffered per client. A client that falls further behind
+    # loses its oldest frames rather than stalling the 1Hz broadcast loop.
+    CLIENT_QUEUE_SIZE = 8
+    # How long stop() waits for queued frames (e.g. session_end) to go out
+    DRAIN_TIMEOUT_SEC = 1.0
+
     def __init__(
         self,
         host: str = "localhost",
@@ -32,7 +39,10 @@ class WebSocketServer:
         self.port = port
         self.allow_multiple_clients = allow_multiple_clients
 
-        self.clients: set[WebSocketServerProtocol] = set()
+        # Each client gets a bounded send queue drained by its own writer task
+        self.clients: dict[
+            WebSocketServerProtocol, tuple[asyncio.Queue, asyncio.Task]
+        ] = {}
         self.server = None
         self.session_id: str | None = None
 
@@ -61,7 +71,10 @@ class WebSocketServer:
         print(f"WebSocket server started on ws://{self.host}:{self.port}/stream")
 
     async def stop(self):
-        """Stop the WebSocket server."""
+        """Stop the WebSocket server (after draining queued frames)."""
+        await self._drain()
+        for websocket in list(self.clients):
+            self._unregister(websocket)
         if self.server:
             self.server.close()
             await self.server.wait_closed()
@@ -71,7 +84,7 @@ class WebSocketServer:
 
         # Check if already connected (single client mode)
         if not self.allow_multiple_clients and self.clients:
-            await websocket.send(json.dumps({
+            await websocket.send(json_codec.dumps({
                 "type": "error",
                 "code": "session_already_active",
                 "message": "Another client is already connected"
@@ -79,14 +92,14 @@ class WebSocketServer:
             await websocket.close()
             return
 
-        self.clients.add(websocket)
+        self._register(websocket)
         print(f"Client connected: {websocket.remote_address}")
 
         try:
             # Wait for hello message
             async for message in websocket:
                 try:
-                    data = json.loads(message)
+                    data = json_codec.loads(message)
                     await self._handle_message(websocket, data)
                 except json.JSONDecodeError:
                     await self._send_error(websocket, "invalid_message", "Malformed JSON")
@@ -96,9 +109,47 @@ class WebSocketServer:
         except websockets.exceptions.ConnectionClosed:
             pass
         finally:
-            self.clients.discard(websocket)
+            self._unregister(websocket)
             print(f"Client disconnected: {websocket.remote_address}")
 
+    def _register(self, websocket: WebSocketServerProtocol):
+        """Give a client its send queue and writer task."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.CLIENT_QUEUE_SIZE)
+        task = asyncio.create_task(self._writer(websocket, queue))
+        self.clients[websocket] = (queue, task)
+
+    def _unregister(self, websocket: WebSocketServerProtocol):
+        """Drop a client and cancel its writer task."""
+        entry = self.clients.pop(websocket, None)
+        if entry:
+            entry[1].cancel()
+
+    @staticmethod
+    async def _writer(websocket: WebSocketServerProtocol, queue: asyncio.Queue):
+        """Send queued payloads to one client in order."""
+        while True:
+            payload = await queue.get()
+            try:
+                await websocket.send(payload)
+            except websockets.exceptions.ConnectionClosed:
+                return
+            except Exception:
+                pass  # one failed frame shouldn't end the stream
+            finally:
+                queue.task_done()
+
+    async def _drain(self):
+        """Wait (bounded) until every client queue has been written out."""
+        if not self.clients:
+            return
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*[queue.join() for queue, _ in self.clients.values()]),
+                timeout=self.DRAIN_TIMEOUT_SEC
+            )
+        except asyncio.TimeoutError:
+            pass
+
     async def _handle_message(self, websocket: WebSocketServerProtocol, data: dict):
         """Route incoming messages by type."""
         msg_type = data.get("type")
@@ -133,7 +184,7 @@ class WebSocketServer:
             "status": "streaming" if self.device_connected else "waiting_for_device"
         }
 
-        await websocket.send(json.dumps(welcome))
+        await websocket.send(json_codec.dumps(welcome))
         print(f"Session started: {self.session_id}")
 
     async def _handle_semiotic_marker(self, data: dict):
@@ -167,7 +218,7 @@ class WebSocketServer:
         now = datetime.now()
         latency_ms = int((now - received_ts).total_seconds() * 1000)
 
-        await websocket.send(json.dumps({
+        await websocket.send(json_codec.dumps({
             "type": "pong",
             "ts": now.isoformat(),
             "latency_ms": latency_ms
@@ -175,7 +226,7 @@ class WebSocketServer:
 
     async def _send_error(self, websocket: WebSocketServerProtocol, code: str, message: str):
         """Send error message to client."""
-        await websocket.send(json.dumps({
+        await websocket.send(json_codec.dumps({
             "type": "error",
             "code": code,
             "message": message
@@ -231,7 +282,21 @@ class WebSocketServer:
             "soft_mode_2d": soft_mode_2d,
         }
 
-    async def broadcast_phase(
+    def _broadcast(self, message: dict):
+        """Queue one message for every connected client.
+
+        Serialized once up front — the payload is identical for every client.
+        Never waits on a socket: the per-client writer tasks do the sends, and
+        a full queue drops its oldest frame so slow clients see fresh data.
+        """
+        payload = json_codec.dumps(message)
+        for queue, _ in self.clients.values():
+            if queue.full():
+                queue.get_nowait()
+                queue.task_done()
+            queue.put_nowait(payload)
+
+    def broadcast_phase(
         self,
         timestamp: datetime,
         hr: int,
@@ -251,7 +316,11 @@ class WebSocketServer:
         mode_score: float = 0.0,
         soft_mode_2d: dict | None = None,
     ):
-        """Broadcast phase dynamics to all connected clients (1Hz)."""
+        """Broadcast phase dynamics to all connected clients (1Hz).
+
+        Synchronous: it only queues the frame (see _broadcast), so the BLE
+        callback can call it directly instead of spawning a task per tick.
+        """
         if not self.clients:
             return
         message = self._build_phase_message(
@@ -261,11 +330,7 @@ class WebSocketServer:
             mode_score, soft_mode_2d,
         )
 
-        # Broadcast to all clients
-        await asyncio.gather(
-            *[client.send(json.dumps(message)) for client in self.clients],
-            return_exceptions=True
-        )
+        self._broadcast(message)
 
     async def broadcast_device_status(self):
         """Broadcast device connection status."""
@@ -280,10 +345,7 @@ class WebSocketServer:
             "battery": self.battery_level
         }
 
-        await asyncio.gather(
-            *[client.send(json.dumps(message)) for client in self.clients],
-            return_exceptions=True
-        )
+        self._broadcast(message)
 
     async def broadcast_session_end(self, duration_sec: int, samples: int):
         """Broadcast session end notification."""
@@ -298,7 +360,4 @@ class WebSocketServer:
             "samples": samples
         }
 
-        await asyncio.gather(
-            *[client.send(json.dumps(message)) for client in self.clients],
-            return_exceptions=True
-        )
+        self._broadcast(message)
@@ -5,7 +5,11 @@ import asyncio
 import json
 import os
 import sys
+import time
+from collections import deque
 from datetime import datetime
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
 
 from ble.scanner import scan_for_polar_h10
@@ -17,6 +21,30 @@ from processing.schema import SCHEMA_VERSION
 from domain.types import SemioticMarker, FieldEvent
 from storage.session_logger import SessionLogger
 from api.websocket_server import WebSocketServer
+from utils.terminal import CLEAR_SCREEN, RowRenderer
+
+
+def _build_rr_bars(width: int, center: int) -> tuple[str, ...]:
+    """Prebuild one RR deviation row per dot position.
+
+    Row i has the dot (●) at column i and the mean line (│) at center; the
+    dot wins where they coincide. format_rr_window indexes into this table
+    instead of assembling a character list for every line of every redraw.
+    """
+    return tuple(
+        ''.join('●' if col == pos else '│' if col == center else ' ' for col in range(width))
+        for pos in range(width)
+    )
+
+
+@lru_cache(maxsize=None)
+def _bar_table(width: int, filled: str, empty: str) -> tuple[str, ...]:
+    """All width+1 renderings of a bar, indexed by filled count.
+
+    The UI only ever draws a handful of (width, glyph) combinations, so each
+    table is built once and every redraw is a tuple lookup.
+    """
+    return tuple(filled * n + empty * (width - n) for n in range(width + 1))
 
 
 class TerminalUI:
@@ -25,9 +53,20 @@ class TerminalUI:
     # ~20 seconds of RRi at ~60 BPM = ~20 intervals
     RR_WINDOW_SIZE = 20
 
+    # RR oscillation view: 50 columns, mean at column 25, ~10ms per column
+    RR_BAR_WIDTH = 50
+    RR_BAR_CENTER = 25
+    _RR_BARS = _build_rr_bars(RR_BAR_WIDTH, RR_BAR_CENTER)
+    _RR_RULE = '─' * RR_BAR_WIDTH
+
     def __init__(self, logger: SessionLogger | None = None, ws_server: WebSocketServer | None = None):
-        self.hr_history: list[int] = []
-        self.rr_buffer: list[tuple[datetime, int]] = []  # (timestamp, rr_ms)
+        self.hr_history: deque[int] = deque(maxlen=60)
+        self._hr_sum: int = 0  # running sum of hr_history, for the O(1) average
+        # ("HH:MM:SS" arrival time, rr_ms); maxlen bounds the window without
+        # re-slicing. The time is formatted once on arrival, not on every redraw.
+        self.rr_buffer: deque[tuple[str, int]] = deque(maxlen=self.RR_WINDOW_SIZE)
+        self.rr_values: list[int] = []  # RR-only view of rr_buffer, refreshed per packet
+        self._rr_window: str = ""  # format_rr_window() text, rebuilt when rr_buffer changes
         self.start_time: datetime | None = None
         self.latest_metrics: HRVMetrics | None = None
         self.latest_dynamics: PhaseDynamics | None = None
@@ -37,11 +76,12 @@ class TerminalUI:
         self.ws_server = ws_server
         self.battery_level: int | None = None
         self.device_name: str | None = None
-        self.last_phase_tick: float = 0.0  # timestamp of last 1Hz phase computation
+        self.last_phase_tick: float = float("-inf")  # time.monotonic() of last 1Hz phase computation
         self.latest_hr: int = 0  # most recent HR for logging
+        self._screen = RowRenderer()
 
     def clear_screen(self):
-        sys.stdout.write('\033[2J\033[H')
+        sys.stdout.write(CLEAR_SCREEN)
         sys.stdout.flush()
 
     def set_device_info(self, client: H10Client):
@@ -62,13 +102,12 @@ class TerminalUI:
     def format_bar(self, value: float, max_value: float, width: int = 10, filled: str = '▇', empty: str = '░') -> str:
         """Format a value as a simple bar graph."""
         ratio = min(1.0, max(0.0, value / max_value))
-        filled_count = int(ratio * width)
-        return filled * filled_count + empty * (width - filled_count)
+        return _bar_table(width, filled, empty)[int(ratio * width)]
 
     def format_dot_bar(self, value: float, width: int = 10, filled: str = '●', empty: str = '○') -> str:
         """Format a 0-1 value as a dot bar."""
-        filled_count = int(value * width)
-        return filled * filled_count + empty * (width - filled_count)
+        ratio = min(1.0, max(0.0, value))
+        return _bar_table(width, filled, empty)[int(ratio * width)]
 
     def format_metrics(self) -> str:
         """Format the HRV metrics display."""
@@ -105,7 +144,7 @@ class TerminalUI:
             return "  Waiting for data..."
 
         # Get window stats
-        rr_values = [rr for _, rr in self.rr_buffer]
+        rr_values = self.rr_values
         avg_rr = sum(rr_values) / len(rr_values)
         min_rr = min(rr_values)
         max_rr = max(rr_values)
@@ -117,24 +156,16 @@ class TerminalUI:
 
         # Show each RR as deviation from mean
         # Using simple ASCII: shorter intervals left, longer right
-        for ts, rr in self.rr_buffer:
+        for time_str, rr in self.rr_buffer:
             deviation = rr - avg_rr
             # Scale: each char ~10ms deviation
-            bar_center = 25
-            bar_pos = bar_center + int(deviation / 10)
-            bar_pos = max(2, min(48, bar_pos))
-
-            # Build the line
-            time_str = ts.strftime('%H:%M:%S')
-            bar = [' '] * 50
-            bar[bar_center] = '│'  # center line (mean)
-            bar[bar_pos] = '●'
-            bar_str = ''.join(bar)
+            bar_pos = self.RR_BAR_CENTER + int(deviation / 10)
+            bar_pos = max(2, min(self.RR_BAR_WIDTH - 2, bar_pos))
 
-            lines.append(f"  {time_str}  {rr:4d}ms {bar_str}")
+            lines.append(f"  {time_str}  {rr:4d}ms {self._RR_BARS[bar_pos]}")
 
         lines.append("")
-        lines.append(f"  {'─' * 50}")
+        lines.append(f"  {self._RR_RULE}")
         lines.append(f"  avg: {avg_rr:.0f}ms  min: {min_rr}ms  max: {max_rr}ms")
 
         return '\n'.join(lines)
@@ -144,28 +175,32 @@ class TerminalUI:
             self.start_time = timestamp
 
         elapsed = (timestamp - self.start_time).total_seconds()
+        if len(self.hr_history) == self.hr_history.maxlen:
+            self._hr_sum -= self.hr_history[0]  # about to be evicted
         self.hr_history.append(data.heart_rate)
+        self._hr_sum += data.heart_rate
         self.latest_hr = data.heart_rate
 
-        # Add new RR intervals to buffer with timestamps
-        for rr in data.rr_intervals:
-            self.rr_buffer.append((timestamp, rr))
-
-        # Trim buffer to window size
-        if len(self.rr_buffer) > self.RR_WINDOW_SIZE:
-            self.rr_buffer = self.rr_buffer[-self.RR_WINDOW_SIZE:]
-
-        # Keep HR history bounded
-        if len(self.hr_history) > 60:
-            self.hr_history = self.hr_history[-60:]
+        # Add new RR intervals to buffer with timestamps (deque drops the oldest)
+        if data.rr_intervals:
+            self.rr_buffer.extend(
+                zip(repeat(timestamp.strftime('%H:%M:%S')), data.rr_intervals)
+            )
 
-        # Compute HRV metrics (every packet, for UI responsiveness)
-        rr_values = [rr for _, rr in self.rr_buffer]
-        self.latest_metrics = compute_hrv_metrics(rr_values)
+        # Compute HRV metrics (every packet, for UI responsiveness). They are
+        # a pure function of the RR window, so packets without new intervals
+        # reuse the last values, list and rendered RR window.
+        if data.rr_intervals or self.latest_metrics is None:
+            self.rr_values = [rr for _, rr in self.rr_buffer]
+            self.latest_metrics = compute_hrv_metrics(self.rr_values)
+            self._rr_window = self.format_rr_window()
+        rr_values = self.rr_values
 
         # 1Hz phase computation and logging
-        # Only compute phase dynamics and log once per second
-        current_time = timestamp.timestamp()
+        # Only compute phase dynamics and log once per second. The gate and the
+        # trajectory clock are monotonic, so wall-clock jumps (NTP) can neither
+        # stall the tick nor produce a bogus dt.
+        current_time = time.monotonic()
         if current_time - self.last_phase_tick >= 1.0:
             self.last_phase_tick = current_time
 
@@ -198,9 +233,9 @@ class TerminalUI:
                     self.latest_coherence
                 )
 
-            # Broadcast phase dynamics via WebSocket at 1Hz
+            # Broadcast phase dynamics via WebSocket at 1Hz (queued per client)
             if self.ws_server and self.latest_dynamics:
-                asyncio.create_task(self.ws_server.broadcast_phase(
+                self.ws_server.broadcast_phase(
                     timestamp=timestamp,
                     hr=self.latest_hr,
                     position=self.latest_dynamics.position,
@@ -223,23 +258,25 @@ class TerminalUI:
                         and self.latest_dynamics.soft_mode_2d is not None
                         else None
                     ),
-                ))
+                )
 
         # Calculate stats
-        avg_hr = sum(self.hr_history) / len(self.hr_history) if self.hr_history else 0
+        avg_hr = self._hr_sum / len(self.hr_history) if self.hr_history else 0
 
         # Redraw screen (every packet for smooth UI)
-        self.clear_screen()
-        print("")
-        print(self.format_header(elapsed, data.heart_rate, avg_hr, data.sensor_contact))
-        print("")
-        print(self.format_metrics())
-        print("")
-        print(self.format_rr_window())
-        print("")
+        frame = '\n'.join([
+            "",
+            self.format_header(elapsed, data.heart_rate, avg_hr, data.sensor_contact),
+            "",
+            self.format_metrics(),
+            "",
+            self._rr_window,
+            "",
+        ])
+        self._screen.render(frame.split('\n'))
 
     def print_summary(self, client: H10Client):
-        rr_values = [rr for _, rr in self.rr_buffer]
+        rr_values = self.rr_values
         print("\n\n" + "-" * 60)
         print("  Session Summary")
         print("-" * 60)
@@ -46,6 +46,7 @@ class DeviceRegistry:
         """Initialize registry with optional custom config path."""
         self.config_path = config_path or self.DEFAULT_CONFIG_PATH
         self._devices: dict[str, DeviceInfo] = {}
+        self._by_label: dict[str, DeviceInfo] = {}  # first device per label
         self._loaded = False
 
     def load(self) -> bool:
@@ -61,6 +62,7 @@ class DeviceRegistry:
                 data = json.load(f)
 
             self._devices.clear()
+            self._by_label.clear()
 
             for serial, info in data.get("devices", {}).items():
                 self._devices[serial] = DeviceInfo(
@@ -71,6 +73,9 @@ class DeviceRegistry:
                     description=info.get("description", "")
                 )
 
+            for device in self._devices.values():
+                self._by_label.setdefault(device.label, device)
+
             self._loaded = True
             return True
 
@@ -98,10 +103,7 @@ class DeviceRegistry:
         Returns:
             DeviceInfo if found, None otherwise.
         """
-        for device in self._devices.values():
-            if device.label == label:
-                return device
-        return None
+        return self._by_label.get(label)
 
     def extract_serial(self, device_name: str) -> Optional[str]:
         """Extract serial from Polar H10 device name.
@@ -56,7 +56,12 @@ class H10Client:
         return self._client is not None and self._client.is_connected
 
     def on_data(self, callback: DataCallback):
-        """Register a callback for heart rate data."""
+        """Register a callback for heart rate data.
+
+        Callbacks are called inline per packet; a coroutine returned by one
+        (async def functions, partials of them, async __call__) is scheduled
+        as a task.
+        """
         self._callbacks.append(callback)
 
     async def connect(self) -> bool:
@@ -68,12 +73,11 @@ class H10Client:
             if self._client.is_connected:
                 self._status.connected = True
 
-                # Get device info
-                if hasattr(self._device, 'name'):
+                # Get device info (a bare address string carries no name)
+                if isinstance(self._device, BLEDevice):
                     self._status.device_name = self._device.name
-                if hasattr(self._device, 'address'):
                     self._status.device_address = self._device.address
-                elif isinstance(self._device, str):
+                else:
                     self._status.device_address = self._device
 
                 # Try to read battery level
@@ -109,27 +113,29 @@ class H10Client:
 
         self._running = True
 
-        def notification_handler(sender, data: bytearray):
-            timestamp = datetime.now()
-            hr_data = parse_heart_rate_measurement(data)
-
-            # Update status
-            self._status.sensor_contact = hr_data.sensor_contact
-            self._status.last_hr = hr_data.heart_rate
-            self._status.last_rr = hr_data.rr_intervals
-            self._status.packets_received += 1
-
-            # Notify callbacks
-            for callback in self._callbacks:
-                result = callback(hr_data, timestamp)
-                if asyncio.iscoroutine(result):
-                    asyncio.create_task(result)
-
         await self._client.start_notify(
             HEART_RATE_MEASUREMENT_CHAR_UUID,
-            notification_handler
+            self._on_notification
         )
 
+    def _on_notification(self, sender, data: bytearray):
+        """Parse one Heart Rate Measurement notification and dispatch it."""
+        timestamp = datetime.now()
+        hr_data = parse_heart_rate_measurement(data)
+
+        # Update status
+        status = self._status
+        status.sensor_contact = hr_data.sensor_contact
+        status.last_hr = hr_data.heart_rate
+        status.last_rr = hr_data.rr_intervals
+        status.packets_received += 1
+
+        # Notify callbacks
+        for callback in self._callbacks:
+            result = callback(hr_data, timestamp)
+            if asyncio.iscoroutine(result):
+                asyncio.create_task(result)
+
     async def run(self):
         """Run the client, maintaining connection."""
         while self._running:
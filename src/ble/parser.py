@@ -4,7 +4,43 @@ import struct
 from dataclasses import dataclass
 
 
-@dataclass
+# Heart Rate Measurement fields are little-endian uint16 (HR in 16-bit
+# format, energy expended, RR intervals). Compiled once at import.
+_U16 = struct.Struct('<H')
+
+
+def _decode_flags(flags: int) -> tuple[bool, bool, bool, bool]:
+    """(hr_format_16bit, sensor_contact, energy_expended_present, rr_interval_present).
+
+    sensor_contact is already resolved: the detected bit when contact sensing
+    is supported (bit 1), otherwise True.
+    """
+    sensor_contact_supported = bool(flags & 0x02)
+    sensor_contact_detected = bool(flags & 0x04)
+    return (
+        bool(flags & 0x01),
+        sensor_contact_detected if sensor_contact_supported else True,
+        bool(flags & 0x08),
+        bool(flags & 0x10),
+    )
+
+
+# Every flags byte decoded up front; packets index this instead of masking.
+_FLAGS = tuple(_decode_flags(flags) for flags in range(256))
+
+
+def _u16_at(data: bytearray, offset: int) -> int:
+    """Little-endian uint16 at offset.
+
+    A truncated packet reads whatever bytes remain (0 if none) rather than
+    raising, so one malformed notification can't break the stream.
+    """
+    if offset + 2 <= len(data):
+        return _U16.unpack_from(data, offset)[0]
+    return int.from_bytes(data[offset:offset+2], byteorder='little')
+
+
+@dataclass(slots=True)
 class HeartRateData:
     """Parsed heart rate measurement data."""
     heart_rate: int  # BPM
@@ -26,19 +62,15 @@ def parse_heart_rate_measurement(data: bytearray) -> HeartRateData:
     - Optional: Energy Expended (2 bytes)
     - Optional: RR-Intervals (2 bytes each, 1/1024 second resolution)
     """
-    flags = data[0]
-
-    hr_format_16bit = bool(flags & 0x01)
-    sensor_contact_supported = bool(flags & 0x02)
-    sensor_contact_detected = bool(flags & 0x04)
-    energy_expended_present = bool(flags & 0x08)
-    rr_interval_present = bool(flags & 0x10)
+    hr_format_16bit, sensor_contact, energy_expended_present, rr_interval_present = (
+        _FLAGS[data[0]]
+    )
 
     offset = 1
 
     # Parse heart rate
     if hr_format_16bit:
-        heart_rate = int.from_bytes(data[offset:offset+2], byteorder='little')
+        heart_rate = _u16_at(data, offset)
         offset += 2
     else:
         heart_rate = data[offset]
@@ -47,23 +79,27 @@ def parse_heart_rate_measurement(data: bytearray) -> HeartRateData:
     # Parse energy expended if present
     energy_expended = None
     if energy_expended_present:
-        energy_expended = int.from_bytes(data[offset:offset+2], byteorder='little')
+        energy_expended = _u16_at(data, offset)
         offset += 2
 
     # Parse RR intervals if present
     rr_intervals = []
     if rr_interval_present:
-        while offset + 1 < len(data):
-            # RR interval in 1/1024 seconds, convert to milliseconds
-            rr_raw = int.from_bytes(data[offset:offset+2], byteorder='little')
-            rr_ms = int(rr_raw * 1000 / 1024)
-            rr_intervals.append(rr_ms)
-            offset += 2
+        # All remaining whole uint16s, unpacked in one call (a trailing odd
+        # byte is ignored). RR is in 1/1024 seconds, converted to milliseconds:
+        # 1000/1024 == 125/128, so (raw * 125) >> 7 is the exact truncated
+        # value in integer arithmetic.
+        count = (len(data) - offset) // 2
+        if count > 0:
+            rr_intervals = [
+                (rr_raw * 125) >> 7
+                for rr_raw in struct.unpack_from(f'<{count}H', data, offset)
+            ]
 
     return HeartRateData(
         heart_rate=heart_rate,
         rr_intervals=rr_intervals,
-        sensor_contact=sensor_contact_detected if sensor_contact_supported else True,
+        sensor_contact=sensor_contact,
         energy_expended=energy_expended
     )
 
@@ -83,7 +119,7 @@ _PMD_ACC_HEADER_LEN = 10
 _ACC_SAMPLE_LEN = 6  # int16 LE x, y, z
 
 
-@dataclass
+@dataclass(slots=True)
 class AccSample:
     """One 3-axis accelerometer sample, in milli-g."""
     x: int
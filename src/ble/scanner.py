@@ -1,10 +1,13 @@
 """BLE device scanner for finding Polar H10."""
 
 import asyncio
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from operator import itemgetter
+from typing import Callable, Optional
 from bleak import BleakScanner
+from bleak.assigned_numbers import AdvertisementDataType
 from bleak.backends.device import BLEDevice
+from bleak.exc import BleakError
 
 from .device_registry import DeviceRegistry, DeviceInfo, get_registry
 
@@ -12,87 +15,192 @@ from .device_registry import DeviceRegistry, DeviceInfo, get_registry
 # Polar H10 identifies via Heart Rate Service
 HEART_RATE_SERVICE_UUID = "0000180d-0000-1000-8000-00805f9b34fb"
 
+# Passive scans that have seen no H10 after this long are restarted active
+ACTIVE_FALLBACK_SEC = 3.0
 
-@dataclass
-class LabeledDevice:
-    """A BLE device with optional registry info."""
-    device: BLEDevice
-    info: Optional[DeviceInfo]  # None if unknown device
+# BlueZ only scans passively through an advertisement monitor, which needs
+# or_patterns: match the H10's name in its primary advertisement.
+# (start position, AD type, content) tuples, as bleak's OrPattern.
+_BLUEZ_H10_PATTERNS = [
+    (0, AdvertisementDataType.COMPLETE_LOCAL_NAME, b"Polar H10"),
+    (0, AdvertisementDataType.SHORTENED_LOCAL_NAME, b"Polar H10"),
+]
 
-    @property
-    def serial(self) -> Optional[str]:
-        """Extract serial from device name."""
-        if self.device.name and "Polar H10 " in self.device.name:
-            return self.device.name.replace("Polar H10 ", "")
-        return None
 
-    @property
-    def label(self) -> str:
-        """Participant label or '?' if unknown."""
-        return self.info.label if self.info else "?"
-
-    @property
-    def strap(self) -> str:
-        """Strap identifier or 'unknown'."""
-        return self.info.strap if self.info else "unknown"
+@dataclass(slots=True)
+class LabeledDevice:
+    """A BLE device with optional registry info.
 
-    @property
-    def is_known(self) -> bool:
-        """Whether this device is in the registry."""
-        return self.info is not None
+    serial, label, strap and is_known are derived once at construction
+    (plain slots, not properties) since display and filter loops read them
+    repeatedly.
+    """
+    device: BLEDevice
+    info: Optional[DeviceInfo]  # None if unknown device
+    serial: Optional[str] = field(init=False, repr=False, compare=False)
+    label: str = field(init=False, repr=False, compare=False)
+    strap: str = field(init=False, repr=False, compare=False)
+    is_known: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Serial from device name
+        name = self.device.name
+        self.serial = name.replace("Polar H10 ", "") if name and "Polar H10 " in name else None
+        # Participant label or '?', strap identifier or 'unknown' if unregistered
+        info = self.info
+        self.is_known = info is not None
+        self.label = info.label if info else "?"
+        self.strap = info.strap if info else "unknown"
 
 
 async def scan_for_polar_h10(
     timeout: float = 10.0,
-    registry: Optional[DeviceRegistry] = None
+    registry: Optional[DeviceRegistry] = None,
+    strict_filter: bool = True,
+    expected: Optional[int] = None,
+    counts: Optional[Callable[[BLEDevice], bool]] = None,
+    passive: bool = True
 ) -> list[BLEDevice]:
     """Scan for Polar H10 devices.
 
     Returns list of discovered H10 devices (raw BLEDevice objects).
     For labeled devices, use scan_for_labeled_devices().
+
+    With strict_filter (default), the OS Bluetooth stack only reports
+    devices advertising the Heart Rate Service, so unrelated advertisements
+    never reach the callback. Pass strict_filter=False to see every
+    advertisement (diagnostics, or a strap that omits the service UUID).
+
+    If expected is given, the scan ends as soon as that many H10s (only those
+    passing counts, if given) have been seen; timeout still bounds it.
+    Otherwise it runs the full timeout.
+
+    The scan starts passive (no scan requests; the H10 puts its name in the
+    primary advertisement) and switches to active if the expected count has
+    not been reached after ACTIVE_FALLBACK_SEC (always, when expected is not
+    given), or straight away where the backend has no passive mode
+    (CoreBluetooth). On BlueZ the passive scan is an
+    advertisement monitor matching the "Polar H10" local name, so
+    strict_filter does not apply to it. Passive scans may not populate
+    advertisement service_data for some peripherals.
     """
-    h10_devices = []
+    h10_devices: dict[str, BLEDevice] = {}  # by address: O(1) dedup per advertisement
+    matched = 0
+    found_enough = asyncio.Event()
+    # The detection callback only enqueues; dedup, printing and counting run
+    # in a consumer task so Bleak's dispatch returns straight away.
+    adverts: asyncio.Queue[BLEDevice] = asyncio.Queue()
 
     def detection_callback(device: BLEDevice, advertisement_data):
-        # Check if device name contains "Polar H10"
+        adverts.put_nowait(device)
+
+    def handle(device: BLEDevice):
+        nonlocal matched
+        # Check if device name contains "Polar H10" (the service filter also
+        # admits other heart rate sensors)
         if device.name and "Polar H10" in device.name:
-            if device not in h10_devices:
-                h10_devices.append(device)
+            if device.address not in h10_devices:
+                h10_devices[device.address] = device
                 print(f"  Found: {device.name} ({device.address})")
-
-    scanner = BleakScanner(detection_callback=detection_callback)
+                if counts is None or counts(device):
+                    matched += 1
+                    if expected is not None and matched >= expected:
+                        found_enough.set()
+
+    async def drain():
+        while True:
+            handle(await adverts.get())
+
+    async def start(mode: str) -> BleakScanner:
+        if mode == "passive":
+            # BlueZ can't filter passive scans by service UUID; the name
+            # patterns select H10 advertisements instead
+            scanner = BleakScanner(
+                detection_callback=detection_callback,
+                scanning_mode=mode,
+                bluez={"or_patterns": _BLUEZ_H10_PATTERNS}
+            )
+        else:
+            scanner = BleakScanner(
+                detection_callback=detection_callback,
+                service_uuids=[HEART_RATE_SERVICE_UUID] if strict_filter else None,
+                scanning_mode=mode
+            )
+        await scanner.start()
+        return scanner
+
+    async def wait_found(limit: float) -> bool:
+        try:
+            await asyncio.wait_for(found_enough.wait(), max(limit, 0))
+            return True
+        except asyncio.TimeoutError:
+            return False
 
     print(f"Scanning for Polar H10 devices ({timeout}s)...")
-    await scanner.start()
-    await asyncio.sleep(timeout)
-    await scanner.stop()
-
-    return h10_devices
+    consumer = asyncio.create_task(drain())
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    scanner = None
+    try:
+        if passive:
+            try:
+                scanner = await start("passive")
+            except BleakError:
+                pass  # backend has no passive mode
+        if scanner is None:
+            scanner = await start("active")
+        elif not await wait_found(min(ACTIVE_FALLBACK_SEC, timeout)):
+            await scanner.stop()
+            scanner = None  # stopped; don't stop again if the restart fails
+            scanner = await start("active")
+        await wait_found(deadline - loop.time())
+    finally:
+        if scanner is not None:
+            await scanner.stop()
+        consumer.cancel()
+        while not adverts.empty():  # advertisements queued before stop()
+            handle(adverts.get_nowait())
+
+    return list(h10_devices.values())
 
 
 async def scan_for_labeled_devices(
     timeout: float = 10.0,
-    registry: Optional[DeviceRegistry] = None
+    registry: Optional[DeviceRegistry] = None,
+    strict_filter: bool = True,
+    expected: Optional[int] = None
 ) -> list[LabeledDevice]:
     """Scan for Polar H10 devices and label them from registry.
 
     Returns list of LabeledDevice objects with registry info attached.
-    Unknown devices will have info=None.
+    Unknown devices will have info=None. expected ends the scan early once
+    that many registered devices are seen; unknown straps don't count.
     """
     if registry is None:
         registry = get_registry()
 
-    devices = await scan_for_polar_h10(timeout=timeout)
+    # Identified once per device, as it is first seen; reused for labeling
+    infos: dict[str, Optional[DeviceInfo]] = {}
 
-    labeled = []
-    for device in devices:
-        info = registry.identify(device.name)
-        labeled.append(LabeledDevice(device=device, info=info))
+    def is_registered(device: BLEDevice) -> bool:
+        info = infos[device.address] = registry.identify(device.name)
+        return info is not None
 
-    # Sort by label (A before B, unknowns last)
-    labeled.sort(key=lambda d: (not d.is_known, d.label))
+    devices = await scan_for_polar_h10(
+        timeout=timeout, strict_filter=strict_filter, expected=expected,
+        counts=is_registered
+    )
 
-    return labeled
+    # Sort by label (A before B, unknowns last); keys built once from the
+    # registry info rather than via the LabeledDevice properties per compare
+    keyed = []
+    for device in devices:
+        info = infos[device.address]
+        key = (False, info.label) if info is not None else (True, "?")
+        keyed.append((key, LabeledDevice(device=device, info=info)))
+    keyed.sort(key=itemgetter(0))
+
+    return [d for _, d in keyed]
 
 
 async def scan_all_devices(timeout: float = 5.0) -> list[BLEDevice]:
@@ -103,6 +211,13 @@ async def scan_all_devices(timeout: float = 5.0) -> list[BLEDevice]:
 
 
 if __name__ == "__main__":
+    import argparse
+
+    ap = argparse.ArgumentParser(description="Scan for labeled Polar H10 devices.")
+    ap.add_argument("--diagnose", action="store_true",
+                    help="if no H10 is found, list every BLE device in range")
+    args = ap.parse_args()
+
     async def main():
         print("\n=== Labeled Device Scan ===\n")
         devices = await scan_for_labeled_devices()
@@ -119,6 +234,9 @@ if __name__ == "__main__":
                     print(f"      Serial: {d.serial}")
                     print(f"      Address: {d.device.address}")
                 print()
+        elif not args.diagnose:
+            print("\nNo Polar H10 found. Make sure the strap is worn (skin contact"
+                  " activates BLE); rerun with --diagnose to list all devices.")
         else:
             print("\nNo Polar H10 found. Scanning all devices...")
             all_devices = await scan_all_devices()
@@ -11,19 +11,25 @@ Usage:
 """
 
 import asyncio
-import json
-import sys
+import time
 from datetime import datetime
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from ble.scanner import scan_for_labeled_devices, LabeledDevice
 from ble.h10_client import H10Client
 from ble.parser import HeartRateData
 from processing.schema import SCHEMA_VERSION
+from utils import json_codec
+from utils.terminal import RowRenderer
 
+try:
+    import uvloop  # libuv event loop: cheaper loop iterations under two streams
+except ImportError:  # optional; Windows has no uvloop and keeps the default loop
+    uvloop = None
 
-@dataclass
+
+@dataclass(slots=True)
 class ParticipantState:
     """Track state for one participant."""
     label: str
@@ -33,16 +39,42 @@ class ParticipantState:
     rr_count: int = 0
     packet_count: int = 0
     connected: bool = False
+    first_packet: asyncio.Event = field(default_factory=asyncio.Event)
 
 
 class DualTestSession:
     """Minimal dual-device test session."""
 
+    # Records are queued in memory and written every FLUSH_EVERY_RECORDS
+    # records or FLUSH_INTERVAL_SEC seconds, whichever comes first, instead
+    # of a write + flush per packet from the BLE callback.
+    FLUSH_EVERY_RECORDS = 16
+    FLUSH_INTERVAL_SEC = 1.0
+
+    # Display refresh: at most every REFRESH_MIN_SEC (coalesces packet
+    # bursts), and at least every REFRESH_IDLE_SEC so the clock keeps moving
+    # and a silent strap is visible.
+    REFRESH_MIN_SEC = 0.1
+    REFRESH_IDLE_SEC = 1.0
+
+    # Stream starts are staggered: the next strap starts once the previous
+    # one has delivered a packet, or after this long at most.
+    STREAM_START_TIMEOUT_SEC = 3.0
+
     def __init__(self):
         self.participants: dict[str, ParticipantState] = {}
         self.session_file: Path | None = None
         self.file_handle = None
         self.start_time: datetime | None = None
+        self._pending: list[bytes] = []
+        self._last_flush = 0.0
+        # Record timestamps reuse the formatted whole-second prefix
+        self._iso_sec: int | None = None
+        self._iso_prefix = ""
+        self.dirty = asyncio.Event()  # set by packet callbacks, awaited by the display
+        # Packets arrive before the log is open; until start_logging() they go
+        # to a no-op, so the per-packet path carries no "is it open?" check.
+        self.log_data = self._discard_data
 
     def start_logging(self) -> Path:
         """Start session log file."""
@@ -51,7 +83,7 @@ class DualTestSession:
 
         timestamp = datetime.now().strftime("%Y-%m-%d_%H%M%S")
         self.session_file = session_dir / f"dyadic_{timestamp}.jsonl"
-        self.file_handle = open(self.session_file, 'w')
+        self.file_handle = open(self.session_file, 'wb', buffering=1 << 16)
         self.start_time = datetime.now()
 
         # Write header with dyadic schema
@@ -66,28 +98,51 @@ class DualTestSession:
             },
             "note": "Dual H10 test session - validating concurrent BLE connections"
         }
-        self.file_handle.write(json.dumps(header) + '\n')
+        self.file_handle.write(json_codec.dumps_line(header))
         self.file_handle.flush()
+        self._last_flush = time.monotonic()
+        self.log_data = self._log_data
 
         return self.session_file
 
-    def log_data(self, participant: str, hr: int, rr_intervals: list[int]):
-        """Log a data point with participant ID."""
-        if not self.file_handle:
-            return
+    @staticmethod
+    def _discard_data(participant: str, hr: int, rr_intervals: list[int]):
+        """log_data while no session file is open."""
 
+    def _log_data(self, participant: str, hr: int, rr_intervals: list[int]):
+        """Log a data point with participant ID (log_data once logging starts)."""
         record = {
-            "ts": datetime.now().isoformat(),
+            "ts": self._now_iso(),
             "participant": participant,
             "hr": hr,
             "rr": rr_intervals
         }
-        self.file_handle.write(json.dumps(record) + '\n')
-        self.file_handle.flush()
+        self._pending.append(json_codec.dumps_line(record))
+        if (len(self._pending) >= self.FLUSH_EVERY_RECORDS
+                or time.monotonic() - self._last_flush >= self.FLUSH_INTERVAL_SEC):
+            self.flush()
+
+    def _now_iso(self) -> str:
+        """Local time as ISO 8601 with microseconds, like datetime.now().isoformat()."""
+        sec, usec = divmod(time.time_ns() // 1000, 1_000_000)
+        if sec != self._iso_sec:
+            self._iso_sec = sec
+            self._iso_prefix = datetime.fromtimestamp(sec).isoformat()
+        return f"{self._iso_prefix}.{usec:06d}"
+
+    def flush(self):
+        """Write queued records to disk."""
+        if self.file_handle and self._pending:
+            self.file_handle.write(b''.join(self._pending))
+            self.file_handle.flush()
+        self._pending.clear()
+        self._last_flush = time.monotonic()
 
     def close(self):
         """Close session file."""
         if self.file_handle:
+            self.log_data = self._discard_data
+            self.flush()
             # Write session end
             end_record = {
                 "type": "session_end",
@@ -100,16 +155,11 @@ class DualTestSession:
                     for label, state in self.participants.items()
                 }
             }
-            self.file_handle.write(json.dumps(end_record) + '\n')
+            self.file_handle.write(json_codec.dumps_line(end_record))
             self.file_handle.close()
             self.file_handle = None
 
 
-def clear_screen():
-    sys.stdout.write('\033[2J\033[H')
-    sys.stdout.flush()
-
-
 def format_display(session: DualTestSession) -> str:
     """Format the dual-display terminal output."""
     if not session.start_time:
@@ -144,7 +194,7 @@ async def main():
     print("\n  Ensure both participants are wearing their straps.\n")
 
     # Scan for labeled devices
-    devices = await scan_for_labeled_devices(timeout=15)
+    devices = await scan_for_labeled_devices(timeout=15, expected=2)
 
     if len(devices) < 2:
         print(f"\n  Found {len(devices)} device(s). Need 2 for dyadic test.")
@@ -177,25 +227,27 @@ async def main():
         client = H10Client(labeled_device.device)
         label = labeled_device.label
 
-        session.participants[label] = ParticipantState(
+        state = session.participants[label] = ParticipantState(
             label=label,
             strap=labeled_device.strap,
             client=client
         )
 
-        # Create callback for this participant
-        def make_callback(participant_label: str):
+        # Create callback for this participant (bound to its state, so no
+        # per-packet participants lookup)
+        def make_callback(state: ParticipantState):
             def callback(data: HeartRateData, timestamp: datetime):
-                state = session.participants[participant_label]
                 state.hr = data.heart_rate
                 state.rr_count += len(data.rr_intervals)
                 state.packet_count += 1
 
                 # Log the data
-                session.log_data(participant_label, data.heart_rate, data.rr_intervals)
+                session.log_data(state.label, data.heart_rate, data.rr_intervals)
+                state.first_packet.set()
+                session.dirty.set()
             return callback
 
-        client.on_data(make_callback(label))
+        client.on_data(make_callback(state))
 
     # Connect to both devices concurrently
     async def connect_device(label: str, state: ParticipantState) -> bool:
@@ -215,71 +267,68 @@ async def main():
         print(f"    [{label}] FAILED after 3 attempts")
         return False
 
-    # Try concurrent connection
-    print("\n  Connecting to both devices...")
-    results = await asyncio.gather(
-        *[connect_device(label, state) for label, state in session.participants.items()],
-        return_exceptions=True
-    )
+    async def disconnect_all():
+        for state in session.participants.values():
+            if state.client.is_connected:
+                await state.client.disconnect()
 
-    # Give BLE stack a moment
-    await asyncio.sleep(2)
+    async def connect_or_fail(label: str, state: ParticipantState):
+        if not await connect_device(label, state):
+            raise ConnectionError(f"[{label}] could not connect")
 
-    # Check if both connected
-    connected_count = sum(1 for s in session.participants.values() if s.connected)
-    if connected_count < 2:
+    # Connect every participant before anything is logged or streamed, so a
+    # failed connect leaves no session file behind. The first failure
+    # cancels the other connect.
+    print("\n  Connecting to both devices...")
+    try:
+        async with asyncio.TaskGroup() as tg:
+            for label, state in session.participants.items():
+                tg.create_task(connect_or_fail(label, state))
+    except Exception as e:
+        for err in getattr(e, "exceptions", (e,)):
+            print(f"    Failed: {err}")
         print("\n  Could not connect both devices. Aborting.")
-        for state in session.participants.values():
-            if state.connected:
-                await state.client.disconnect()
+        await disconnect_all()
         return
 
-    # Start logging
-    session_file = session.start_logging()
-    print(f"\n  Logging to: {session_file}")
-    print("\n  Starting streams...\n")
-
-    await asyncio.sleep(1)
+    print(f"\n  Logging to: {session.start_logging()}\n")
 
-    # Verify connections still alive before streaming
-    print("  Verifying connections...")
+    # Stagger stream starts: each strap starts once the previous one has
+    # sent its first packet (or STREAM_START_TIMEOUT_SEC has passed)
+    previous: asyncio.Event | None = None
     for label, state in session.participants.items():
+        if previous is not None:
+            try:
+                await asyncio.wait_for(previous.wait(), session.STREAM_START_TIMEOUT_SEC)
+            except asyncio.TimeoutError:
+                print("    No data yet, continuing...")
         if not state.client.is_connected:
             print(f"    [{label}] Connection lost! Attempting reconnect...")
-            if await state.client.connect():
-                print(f"    [{label}] Reconnected!")
-            else:
+            if not await state.client.connect():
                 print(f"    [{label}] Reconnect FAILED")
-                state.connected = False
-
-    # Re-check connection count
-    connected_count = sum(1 for s in session.participants.values() if s.connected and s.client.is_connected)
-    if connected_count < 2:
-        print("\n  Lost connection to one or more devices. Aborting.")
-        for state in session.participants.values():
-            if state.client.is_connected:
-                await state.client.disconnect()
-        session.close()
-        return
-
-    # Start streaming from both (with delay between)
-    for label, state in session.participants.items():
-        try:
-            await state.client.start_streaming()
-            print(f"    [{label}] Streaming...")
-            await asyncio.sleep(1)  # Stagger stream starts
-        except Exception as e:
-            print(f"    [{label}] Stream failed: {e}")
-            state.connected = False
+                print("\n  Lost connection to one or more devices. Aborting.")
+                await disconnect_all()
+                session.close()
+                return
+        await state.client.start_streaming()
+        print(f"    [{label}] Streaming...")
+        previous = state.first_packet
+    session_file = session.session_file
 
     await asyncio.sleep(1)
 
     # Run display loop
     try:
+        # Redraw when packets arrive rather than on a fixed poll
+        renderer = RowRenderer()
         while True:
-            clear_screen()
-            print(format_display(session))
-            await asyncio.sleep(0.5)
+            session.dirty.clear()
+            renderer.render(format_display(session).split('\n'))
+            await asyncio.sleep(session.REFRESH_MIN_SEC)
+            try:
+                await asyncio.wait_for(session.dirty.wait(), session.REFRESH_IDLE_SEC)
+            except asyncio.TimeoutError:
+                pass
     except KeyboardInterrupt:
         pass
     finally:
@@ -309,7 +358,8 @@ async def main():
 
 
 if __name__ == "__main__":
+    run = uvloop.run if uvloop is not None else asyncio.run
     try:
-        asyncio.run(main())
+        run(main())
     except KeyboardInterrupt:
         print("\n  Stopped")
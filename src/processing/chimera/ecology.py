@@ -5,9 +5,14 @@ The sanctuary is the living ecology of chimeras. It persists across
 sessions and evolves when the participant isn't looking.
 """
 
+import hashlib
 import json
+import mmap
+import os
+import pickle
 import random
-from dataclasses import asdict
+from collections import Counter
+from sys import intern
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -16,6 +21,90 @@ from .types import (
     Chimera, ChimeraState, Country, Encounter, Niche, Sanctuary, Species
 )
 
+try:
+    import orjson
+except ImportError:  # optional accelerator — see requirements.txt
+    orjson = None
+
+
+# Record serializers for save()'s stdlib path. Field lists are spelled out
+# (in dataclass field order, matching the files asdict() used to produce)
+# rather than reflected per record; they must match the public dataclass
+# fields in types.py, which is what orjson emits natively.
+
+def _country_to_dict(c: Country) -> dict:
+    return {
+        "name": c.name,
+        "bioregion": c.bioregion,
+        "acknowledgment": c.acknowledgment,
+        "bounds": c.bounds,
+    }
+
+
+def _species_to_dict(s: Species) -> dict:
+    return {
+        "scientific_name": s.scientific_name,
+        "common_name": s.common_name,
+        "taxon_group": s.taxon_group,
+        "family": s.family,
+        "notes": s.notes,
+        "qualities": s.qualities,
+        "niche_affinities": [n.value for n in s.niche_affinities],
+        "encounter_count": s.encounter_count,
+        "witnessed_in_chimeras": s.witnessed_in_chimeras,
+    }
+
+
+def _chimera_to_dict(c: Chimera) -> dict:
+    return {
+        "id": c.id,
+        "components": c.components,
+        "weights": c.weights,
+        "lineage": c.lineage,
+        "birth_ts": c.birth_ts,
+        "last_encountered_ts": c.last_encountered_ts,
+        "encounter_count": c.encounter_count,
+        "niche": c.niche.value if c.niche else None,
+        "state": c.state.value,
+        "drift_rate": c.drift_rate,
+        "last_drift_ts": c.last_drift_ts,
+    }
+
+
+def _encounter_to_dict(e: Encounter) -> dict:
+    return {
+        "ts": e.ts,
+        "chimera_id": e.chimera_id,
+        "witnessed": e.witnessed,
+        "phase_context": e.phase_context,
+    }
+
+
+_TO_DICT = {
+    Country: _country_to_dict,
+    Species: _species_to_dict,
+    Chimera: _chimera_to_dict,
+    Encounter: _encounter_to_dict,
+}
+
+
+def _record_to_dict(obj) -> dict:
+    """json.dumps default= hook: encode sanctuary records as they are reached."""
+    try:
+        return _TO_DICT[type(obj)](obj)
+    except KeyError:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable") from None
+
+
+# Shared by the encounter_history and threshold_history sections of load()
+def _encounter_from_dict(item: dict) -> Encounter:
+    return Encounter(
+        ts=item["ts"],
+        chimera_id=item["chimera_id"],
+        witnessed=item["witnessed"],
+        phase_context=item.get("phase_context", {})
+    )
+
 
 class SanctuaryManager:
     """
@@ -24,12 +113,17 @@ class SanctuaryManager:
 
     def __init__(self, sanctuary: Sanctuary):
         self.sanctuary = sanctuary
+        # (path, payload digest, mtime_ns, size) of the last file save() wrote
+        self._last_written: Optional[tuple] = None
 
     @classmethod
     def load(cls, path: Path) -> "SanctuaryManager":
         """Load sanctuary from JSON file."""
-        with open(path) as f:
-            data = json.load(f)
+        if orjson is not None:
+            data = orjson.loads(Path(path).read_bytes())
+        else:
+            with open(path) as f:
+                data = json.load(f)
 
         sanctuary = Sanctuary(
             schema_version=data.get("schema_version", "0.1.0"),
@@ -37,15 +131,25 @@ class SanctuaryManager:
             last_evolution_ts=data.get("last_evolution_ts")
         )
 
+        # Enum decoding by plain dict lookup rather than Enum.__call__ per value
+        niche_by_value = {n.value: n for n in Niche}
+        state_by_value = {s.value: s for s in ChimeraState}
+
+        # Each section is popped off the parsed tree as it is converted, so its
+        # raw dicts are freed before the next section's objects are built and
+        # peak memory stays near one copy of the sanctuary.
+
         # Load country
         if "country" in data:
             sanctuary.country = Country(**data["country"])
 
-        # Load species vocabulary
-        for item in data.get("species_vocabulary", []):
-            niche_affinities = [Niche(n) for n in item.get("niche_affinities", [])]
+        # Load species vocabulary. Scientific names (here and in chimera
+        # components) are interned: every chimera sharing a species then
+        # shares one string, and set/dict lookups short-circuit on identity.
+        for item in data.pop("species_vocabulary", []):
+            niche_affinities = [niche_by_value[n] for n in item.get("niche_affinities", [])]
             species = Species(
-                scientific_name=item["scientific_name"],
+                scientific_name=intern(item["scientific_name"]),
                 common_name=item.get("common_name", ""),
                 taxon_group=item.get("taxon_group", ""),
                 family=item.get("family", ""),
@@ -58,41 +162,25 @@ class SanctuaryManager:
             sanctuary.species_vocabulary.append(species)
 
         # Load chimeras
-        for item in data.get("chimeras", []):
+        for item in data.pop("chimeras", []):
             chimera = Chimera(
                 id=item["id"],
-                components=item.get("components", []),
+                components=[intern(name) for name in item.get("components", [])],
                 weights=item.get("weights", []),
                 lineage=item.get("lineage", []),
                 birth_ts=item.get("birth_ts", ""),
                 last_encountered_ts=item.get("last_encountered_ts"),
                 encounter_count=item.get("encounter_count", 0),
-                niche=Niche(item["niche"]) if item.get("niche") else None,
-                state=ChimeraState(item.get("state", "sanctuary")),
+                niche=niche_by_value[item["niche"]] if item.get("niche") else None,
+                state=state_by_value[item.get("state", "sanctuary")],
                 drift_rate=item.get("drift_rate", 1.0),
                 last_drift_ts=item.get("last_drift_ts")
             )
             sanctuary.chimeras.append(chimera)
 
-        # Load encounter history
-        for item in data.get("encounter_history", []):
-            encounter = Encounter(
-                ts=item["ts"],
-                chimera_id=item["chimera_id"],
-                witnessed=item["witnessed"],
-                phase_context=item.get("phase_context", {})
-            )
-            sanctuary.encounter_history.append(encounter)
-
-        # Load threshold history
-        for item in data.get("threshold_history", []):
-            encounter = Encounter(
-                ts=item["ts"],
-                chimera_id=item["chimera_id"],
-                witnessed=item["witnessed"],
-                phase_context=item.get("phase_context", {})
-            )
-            sanctuary.threshold_history.append(encounter)
+        # Load encounter and threshold history
+        sanctuary.encounter_history = list(map(_encounter_from_dict, data.pop("encounter_history", [])))
+        sanctuary.threshold_history = list(map(_encounter_from_dict, data.pop("threshold_history", [])))
 
         return cls(sanctuary)
 
@@ -104,41 +192,82 @@ class SanctuaryManager:
             "last_evolution_ts": self.sanctuary.last_evolution_ts,
         }
 
-        # Save country
+        # Records go in as the dataclasses themselves and are converted while
+        # encoding, so no list of per-record dicts is built first: orjson
+        # serializes dataclasses (public fields, in order) and enums (by
+        # value) natively; the stdlib path converts one record at a time
+        # through _record_to_dict.
         if self.sanctuary.country:
-            data["country"] = asdict(self.sanctuary.country)
-
-        # Save species vocabulary
-        data["species_vocabulary"] = []
-        for s in self.sanctuary.species_vocabulary:
-            item = asdict(s)
-            item["niche_affinities"] = [n.value for n in s.niche_affinities]
-            data["species_vocabulary"].append(item)
-
-        # Save chimeras
-        data["chimeras"] = []
+            data["country"] = self.sanctuary.country
+        data["species_vocabulary"] = self.sanctuary.species_vocabulary
+        data["chimeras"] = self.sanctuary.chimeras
+        data["encounter_history"] = self.sanctuary.encounter_history
+        data["threshold_history"] = self.sanctuary.threshold_history
+
+        # Ecology metrics, gathered in one pass over the chimeras (the same
+        # figures as the witnessed_chimeras / sanctuary_chimeras /
+        # niche_coverage / empty_niches properties)
+        witnessed_count = 0
+        sanctuary_count = 0
+        occupied = set()
         for c in self.sanctuary.chimeras:
-            item = asdict(c)
-            item["niche"] = c.niche.value if c.niche else None
-            item["state"] = c.state.value
-            data["chimeras"].append(item)
-
-        # Save encounters
-        data["encounter_history"] = [asdict(e) for e in self.sanctuary.encounter_history]
-        data["threshold_history"] = [asdict(e) for e in self.sanctuary.threshold_history]
-
-        # Ecology metrics
+            if c.state == ChimeraState.ENCOUNTERED:
+                witnessed_count += 1
+            elif c.state in (ChimeraState.SANCTUARY, ChimeraState.FERAL):
+                sanctuary_count += 1
+            if c.niche:
+                occupied.add(c.niche)
         data["ecology_metrics"] = {
             "total_chimeras": len(self.sanctuary.chimeras),
-            "witnessed_count": len(self.sanctuary.witnessed_chimeras),
-            "sanctuary_count": len(self.sanctuary.sanctuary_chimeras),
-            "niche_coverage": [n.value for n in self.sanctuary.niche_coverage],
-            "empty_niches": [n.value for n in self.sanctuary.empty_niches],
+            "witnessed_count": witnessed_count,
+            "sanctuary_count": sanctuary_count,
+            "niche_coverage": [n.value for n in occupied],
+            "empty_niches": [n.value for n in Niche if n not in occupied],
             "diversity_index": self.compute_diversity_index()
         }
 
-        with open(path, "w") as f:
-            json.dump(data, f, indent=2)
+        if orjson is not None:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(data, indent=2, default=_record_to_dict).encode()
+
+        # Skip the write when this exact payload is what our last save left
+        # at path (and the file hasn't been touched since)
+        path = Path(path)
+        digest = hashlib.blake2b(payload, digest_size=16).digest()
+        try:
+            st = path.stat()
+            if self._last_written == (path, digest, st.st_mtime_ns, st.st_size):
+                return
+        except FileNotFoundError:
+            pass
+
+        # Write-then-rename so an interrupted save never truncates the file
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_bytes(payload)
+        os.replace(tmp, path)
+        st = path.stat()
+        self._last_written = (path, digest, st.st_mtime_ns, st.st_size)
+
+    def save_binary(self, path: Path) -> None:
+        """
+        Save a binary snapshot of the sanctuary (pickle).
+
+        For fast machine-only reloads between runs; the JSON file from
+        save() stays the human-readable, portable record. Snapshots are
+        tied to the current class definitions and, being pickles, must only
+        be loaded from files this program wrote.
+        """
+        Path(path).write_bytes(pickle.dumps(self.sanctuary, protocol=pickle.HIGHEST_PROTOCOL))
+
+    @classmethod
+    def load_binary(cls, path: Path) -> "SanctuaryManager":
+        """Load a snapshot written by save_binary(), memory-mapping the file."""
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            sanctuary = pickle.loads(mm)
+        if not isinstance(sanctuary, Sanctuary):
+            raise TypeError(f"{path} is not a sanctuary snapshot")
+        return cls(sanctuary)
 
     def compute_diversity_index(self) -> float:
         """
@@ -148,39 +277,38 @@ class SanctuaryManager:
         - Niche coverage (how many niches are occupied)
         - Component diversity (how many species are used)
         - Balance (how evenly distributed chimeras are across niches)
+
+        Cached on the sanctuary until a mutation invalidates it.
         """
-        if not self.sanctuary.chimeras:
+        cached = self.sanctuary._diversity_cache
+        if cached is None:
+            cached = self.sanctuary._diversity_cache = self._diversity_index()
+        return cached
+
+    def _diversity_index(self) -> float:
+        chimeras = self.sanctuary.chimeras
+        if not chimeras:
             return 0.0
 
+        # Chimeras per occupied niche (one pass, counted in C)
+        niche_counts = Counter(c.niche for c in chimeras if c.niche)
+
         # Niche coverage component
         total_niches = len(Niche)
-        occupied_niches = len(self.sanctuary.niche_coverage)
-        niche_score = occupied_niches / total_niches
+        niche_score = len(niche_counts) / total_niches
 
         # Species usage component
         total_species = len(self.sanctuary.species_vocabulary)
         if total_species == 0:
             return niche_score * 0.5
 
-        used_species = set()
-        for c in self.sanctuary.chimeras:
-            used_species.update(c.components)
+        used_species = set().union(*[c.components for c in chimeras])
         species_score = len(used_species) / total_species
 
         # Balance component (evenness of niche distribution)
-        niche_counts = {}
-        for c in self.sanctuary.chimeras:
-            if c.niche:
-                niche_counts[c.niche] = niche_counts.get(c.niche, 0) + 1
-
         if niche_counts:
-            counts = list(niche_counts.values())
-            max_count = max(counts)
-            min_count = min(counts)
-            if max_count > 0:
-                balance_score = min_count / max_count
-            else:
-                balance_score = 1.0
+            counts = niche_counts.values()
+            balance_score = min(counts) / max(counts)
         else:
             balance_score = 0.0
 
@@ -213,16 +341,10 @@ class SanctuaryManager:
         if len(candidates) <= num_components:
             selected = candidates
         else:
-            # Weight by how many times species has been witnessed (less = more likely)
-            weights = []
-            for s in candidates:
-                # Invert encounter count: less encountered = higher weight
-                w = 1.0 / (1.0 + s.encounter_count * 0.5)
-                weights.append(w)
-
-            # Normalize
-            total = sum(weights)
-            weights = [w / total for w in weights]
+            # Weight by how many times species has been witnessed (less = more
+            # likely): inverted encounter count. random.choices takes relative
+            # weights, so no normalization pass.
+            weights = [1.0 / (1.0 + s.encounter_count * 0.5) for s in candidates]
 
             selected = random.choices(candidates, weights=weights, k=num_components)
 
@@ -237,6 +359,7 @@ class SanctuaryManager:
         )
 
         self.sanctuary.chimeras.append(chimera)
+        self.sanctuary.invalidate_diversity()
         return chimera
 
     def _generate_weights(self, n: int) -> list[float]:
@@ -255,10 +378,10 @@ class SanctuaryManager:
                 secondary = 1.0 - primary - tertiary
             return [primary, secondary, tertiary]
         else:
-            # Dirichlet-ish distribution
-            raw = [random.random() for _ in range(n)]
-            total = sum(raw)
-            return [r / total for r in raw]
+            # Flat Dirichlet: normalized unit exponentials (Gamma(1) draws)
+            raw = [random.expovariate(1.0) for _ in range(n)]
+            scale = 1.0 / sum(raw)
+            return [r * scale for r in raw]
 
     def seed_initial_chimeras(self, count: int = 5) -> list[Chimera]:
         """
@@ -291,8 +414,9 @@ class SanctuaryManager:
     def get_chimera_display_name(self, chimera: Chimera) -> str:
         """Get a display name for a chimera using common names."""
         names = []
+        species_index = self.sanctuary.species_index
         for sci_name, weight in chimera.weighted_components():
-            species = self.sanctuary.species_by_name(sci_name)
+            species = species_index.get(sci_name)
             if species:
                 name = species.common_name or species.scientific_name.split()[-1]
                 names.append(name)
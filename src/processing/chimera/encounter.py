@@ -10,12 +10,17 @@ Unwitnessed chimeras stay wild.
 Neither is more true.
 """
 
+import time
+from collections import Counter
 from datetime import datetime, timedelta
 from typing import Optional
 
 from .types import Chimera, ChimeraState, Encounter, Sanctuary
 
 
+SECONDS_PER_DAY = 86400
+
+
 def on_witnessed(
     chimera: Chimera,
     sanctuary: Sanctuary,
@@ -51,12 +56,12 @@ def on_witnessed(
     chimera.drift_rate = max(chimera.drift_rate, 0.1)  # Floor at 0.1
 
     # Update species encounter counts
+    species_index = sanctuary.species_index
     for species_name in chimera.components:
-        species = sanctuary.species_by_name(species_name)
+        species = species_index.get(species_name)
         if species:
             species.encounter_count += 1
-            if chimera.id not in species.witnessed_in_chimeras:
-                species.witnessed_in_chimeras.append(chimera.id)
+            species.add_witnessed_chimera(chimera.id)
 
     # Create encounter record
     encounter = Encounter(
@@ -141,20 +146,24 @@ def maybe_go_feral(
     if chimera.state != ChimeraState.ENCOUNTERED:
         return False
 
+    cutoff = time.time() - feral_threshold_days * SECONDS_PER_DAY
+    return _go_feral_if_unmet_since(chimera, cutoff)
+
+
+def _go_feral_if_unmet_since(chimera: Chimera, cutoff: float) -> bool:
+    """Feral transition for a witnessed chimera not encountered after cutoff (epoch seconds)."""
     if not chimera.last_encountered_ts:
         return False
 
     try:
-        last_encounter = datetime.fromisoformat(chimera.last_encountered_ts)
-        days_since = (datetime.now() - last_encounter).days
-
-        if days_since >= feral_threshold_days:
-            chimera.state = ChimeraState.FERAL
-            chimera.drift_rate = 1.0  # Reset drift rate
-            return True
-
+        last_encounter = chimera.last_encountered_epoch
     except ValueError:
-        pass
+        return False
+
+    if last_encounter <= cutoff:
+        chimera.state = ChimeraState.FERAL
+        chimera.drift_rate = 1.0  # Reset drift rate
+        return True
 
     return False
 
@@ -169,13 +178,15 @@ def check_all_for_feral(
     Returns:
         List of chimera IDs that went feral
     """
-    feral_ids = []
+    # One cutoff for the whole sweep; each check is then a float compare
+    cutoff = time.time() - feral_threshold_days * SECONDS_PER_DAY
 
-    for chimera in sanctuary.witnessed_chimeras:
-        if maybe_go_feral(chimera, feral_threshold_days):
-            feral_ids.append(chimera.id)
-
-    return feral_ids
+    return [
+        chimera.id
+        for chimera in sanctuary.chimeras
+        if chimera.state == ChimeraState.ENCOUNTERED
+        and _go_feral_if_unmet_since(chimera, cutoff)
+    ]
 
 
 def get_encounter_summary(sanctuary: Sanctuary) -> dict:
@@ -189,12 +200,8 @@ def get_encounter_summary(sanctuary: Sanctuary) -> dict:
     # Witness rate
     witness_rate = total_witnessed / total_thresholds if total_thresholds > 0 else 0
 
-    # Most witnessed chimeras
-    chimera_counts = {}
-    for encounter in sanctuary.encounter_history:
-        chimera_counts[encounter.chimera_id] = chimera_counts.get(encounter.chimera_id, 0) + 1
-
-    most_witnessed = sorted(chimera_counts.items(), key=lambda x: x[1], reverse=True)[:5]
+    # Most witnessed chimeras (most_common keeps first-seen order on ties)
+    most_witnessed = Counter(e.chimera_id for e in sanctuary.encounter_history).most_common(5)
 
     # Recent encounters
     recent = sanctuary.encounter_history[-5:] if sanctuary.encounter_history else []
@@ -9,6 +9,8 @@ It's evolving toward a living ecology of them.
 """
 
 import random
+import time
+from bisect import insort
 from datetime import datetime, timedelta
 from typing import Optional
 
@@ -65,34 +67,32 @@ def drift(
         i, j = random.sample(range(len(chimera.weights)), 2)
         shift = random.uniform(0.05, 0.15) * random.choice([-1, 1])
 
-        chimera.weights[i] += shift
-        chimera.weights[j] -= shift
+        weights = chimera.weights
+        weights[i] += shift
+        weights[j] -= shift
 
-        # Clamp and renormalize
-        chimera.weights = [max(0.05, w) for w in chimera.weights]
-        total = sum(chimera.weights)
-        chimera.weights = [w / total for w in chimera.weights]
+        # Clamp and renormalize in place
+        weights[:] = [w if w > 0.05 else 0.05 for w in weights]
+        total = sum(weights)
+        weights[:] = [w / total for w in weights]
         modified = True
 
     # 2. Component swap (less common)
     if random.random() < 0.2 and sanctuary.species_vocabulary:
         # Find species in same niche or family
         current_components = set(chimera.components)
+        species_index = sanctuary.species_index
+        current_families = {
+            species_index[name].family for name in current_components if name in species_index
+        }
 
         # Candidates: same niche affinity or same family
-        candidates = []
-        for s in sanctuary.species_vocabulary:
-            if s.scientific_name in current_components:
-                continue
-            if chimera.niche and chimera.niche in s.niche_affinities:
-                candidates.append(s)
-            elif any(
-                existing.family == s.family
-                for sci_name in current_components
-                for existing in sanctuary.species_vocabulary
-                if existing.scientific_name == sci_name
-            ):
-                candidates.append(s)
+        candidates = [
+            s for s in sanctuary.species_vocabulary
+            if s.scientific_name not in current_components
+            and ((chimera.niche and chimera.niche in s.niche_affinities)
+                 or s.family in current_families)
+        ]
 
         if candidates:
             # Swap the weakest component
@@ -111,42 +111,43 @@ def drift(
 
     if modified:
         chimera.last_drift_ts = datetime.now().isoformat()
+        sanctuary.invalidate_diversity()
 
     return modified
 
 
-def _get_adjacent_niches(niche: Optional[Niche]) -> list[Niche]:
-    """Get niches that are 'adjacent' to the given niche."""
-    if not niche:
-        return list(Niche)
-
-    # Define adjacency based on niche categories
-    adjacency = {
-        # Grip niches are adjacent to each other and to transition
-        Niche.GRIP_PREDATOR: [Niche.GRIP_VIGILANT, Niche.FLOW_SCANNING, Niche.TRANSITION_LIMINAL],
-        Niche.GRIP_PREY: [Niche.GRIP_VIGILANT, Niche.GRIP_SHELTERING, Niche.SETTLING_DORMANT],
-        Niche.GRIP_VIGILANT: [Niche.GRIP_PREDATOR, Niche.GRIP_PREY, Niche.GRIP_SHELTERING],
-        Niche.GRIP_SHELTERING: [Niche.GRIP_VIGILANT, Niche.SETTLING_ROOTED, Niche.SETTLING_ELDER],
-
-        # Flow niches are adjacent to each other
-        Niche.FLOW_MIGRATORY: [Niche.FLOW_SCANNING, Niche.TRANSITION_METAMORPHIC],
-        Niche.FLOW_DISTRIBUTED: [Niche.FLOW_MIGRATORY, Niche.SETTLING_ROOTED],
-        Niche.FLOW_SCANNING: [Niche.GRIP_PREDATOR, Niche.FLOW_MIGRATORY],
-        Niche.FLOW_CALLING: [Niche.FLOW_SCANNING, Niche.SETTLING_DAWN],
-
-        # Transition niches connect grip/flow to settling
-        Niche.TRANSITION_METAMORPHIC: [Niche.FLOW_MIGRATORY, Niche.SETTLING_DORMANT],
-        Niche.TRANSITION_LIMINAL: [Niche.GRIP_PREDATOR, Niche.TRANSITION_TRICKSTER],
-        Niche.TRANSITION_TRICKSTER: [Niche.TRANSITION_LIMINAL, Niche.FLOW_CALLING],
-
-        # Settling niches are adjacent to each other
-        Niche.SETTLING_DORMANT: [Niche.SETTLING_ROOTED, Niche.GRIP_PREY],
-        Niche.SETTLING_ROOTED: [Niche.SETTLING_DORMANT, Niche.SETTLING_ELDER, Niche.GRIP_SHELTERING],
-        Niche.SETTLING_DAWN: [Niche.SETTLING_ROOTED, Niche.FLOW_CALLING],
-        Niche.SETTLING_ELDER: [Niche.SETTLING_ROOTED, Niche.GRIP_SHELTERING],
-    }
+# Niches 'adjacent' to each niche, for drift and niche shifts
+_ADJACENCY: dict[Niche, tuple[Niche, ...]] = {
+    # Grip niches are adjacent to each other and to transition
+    Niche.GRIP_PREDATOR: (Niche.GRIP_VIGILANT, Niche.FLOW_SCANNING, Niche.TRANSITION_LIMINAL),
+    Niche.GRIP_PREY: (Niche.GRIP_VIGILANT, Niche.GRIP_SHELTERING, Niche.SETTLING_DORMANT),
+    Niche.GRIP_VIGILANT: (Niche.GRIP_PREDATOR, Niche.GRIP_PREY, Niche.GRIP_SHELTERING),
+    Niche.GRIP_SHELTERING: (Niche.GRIP_VIGILANT, Niche.SETTLING_ROOTED, Niche.SETTLING_ELDER),
+
+    # Flow niches are adjacent to each other
+    Niche.FLOW_MIGRATORY: (Niche.FLOW_SCANNING, Niche.TRANSITION_METAMORPHIC),
+    Niche.FLOW_DISTRIBUTED: (Niche.FLOW_MIGRATORY, Niche.SETTLING_ROOTED),
+    Niche.FLOW_SCANNING: (Niche.GRIP_PREDATOR, Niche.FLOW_MIGRATORY),
+    Niche.FLOW_CALLING: (Niche.FLOW_SCANNING, Niche.SETTLING_DAWN),
+
+    # Transition niches connect grip/flow to settling
+    Niche.TRANSITION_METAMORPHIC: (Niche.FLOW_MIGRATORY, Niche.SETTLING_DORMANT),
+    Niche.TRANSITION_LIMINAL: (Niche.GRIP_PREDATOR, Niche.TRANSITION_TRICKSTER),
+    Niche.TRANSITION_TRICKSTER: (Niche.TRANSITION_LIMINAL, Niche.FLOW_CALLING),
+
+    # Settling niches are adjacent to each other
+    Niche.SETTLING_DORMANT: (Niche.SETTLING_ROOTED, Niche.GRIP_PREY),
+    Niche.SETTLING_ROOTED: (Niche.SETTLING_DORMANT, Niche.SETTLING_ELDER, Niche.GRIP_SHELTERING),
+    Niche.SETTLING_DAWN: (Niche.SETTLING_ROOTED, Niche.FLOW_CALLING),
+    Niche.SETTLING_ELDER: (Niche.SETTLING_ROOTED, Niche.GRIP_SHELTERING),
+}
+
+_ALL_NICHES = tuple(Niche)
+
 
-    return adjacency.get(niche, [])
+def _get_adjacent_niches(niche: Optional[Niche]) -> tuple[Niche, ...]:
+    """Get niches that are 'adjacent' to the given niche (every niche if None)."""
+    return _ADJACENCY.get(niche, ()) if niche else _ALL_NICHES
 
 
 def apply_niche_pressure(sanctuary: Sanctuary) -> list[str]:
@@ -186,43 +187,67 @@ def apply_niche_pressure(sanctuary: Sanctuary) -> list[str]:
                 events.append(f"Niche pressure: {victim.id} suppressed in {niche.value}")
 
     # 2. Witnessed chimeras cast shadow
+    # Sanctuary chimeras by niche, as (position, chimera) in sanctuary order;
+    # a pushed chimera is moved to its new niche's list at its position, so
+    # later witnessed chimeras see the same neighbours, in the same order, as
+    # a scan of the whole sanctuary would.
+    sanctuary_by_niche: dict[Niche, list[tuple[int, Chimera]]] = {}
+    for position, other in enumerate(sanctuary.sanctuary_chimeras):
+        sanctuary_by_niche.setdefault(other.niche, []).append((position, other))
+
     for c in sanctuary.witnessed_chimeras:
-        if c.niche:
+        if c.niche and c.niche in sanctuary_by_niche:
+            components = set(c.components)
             # Find unwitnessed chimeras in same niche with similar components
-            for other in sanctuary.sanctuary_chimeras:
-                if other.niche == c.niche and other.id != c.id:
-                    # Check component overlap
-                    overlap = set(c.components) & set(other.components)
-                    if len(overlap) >= 2:  # High overlap
-                        # Push toward adjacent niche
-                        adjacent = _get_adjacent_niches(other.niche)
-                        if adjacent:
-                            old_niche = other.niche
-                            other.niche = random.choice(adjacent)
-                            events.append(
-                                f"Shadow effect: {other.id} pushed from {old_niche.value} to {other.niche.value}"
-                            )
+            residents = sanctuary_by_niche[c.niche]
+            for entry in list(residents):
+                other = entry[1]
+                if other.id == c.id:
+                    continue
+                # Check component overlap
+                overlap = components.intersection(other.components)
+                if len(overlap) >= 2:  # High overlap
+                    # Push toward adjacent niche
+                    adjacent = _get_adjacent_niches(other.niche)
+                    if adjacent:
+                        old_niche = other.niche
+                        other.niche = random.choice(adjacent)
+                        residents.remove(entry)
+                        insort(sanctuary_by_niche.setdefault(other.niche, []), entry)
+                        events.append(
+                            f"Shadow effect: {other.id} pushed from {old_niche.value} to {other.niche.value}"
+                        )
 
     # 3. Empty niches attract drift
     empty_niches = sanctuary.empty_niches
     if empty_niches:
+        species_index = sanctuary.species_index
+        # Species name -> first empty niche it has affinity for (None if none),
+        # worked out once per species rather than per chimera
+        attraction: dict[str, Optional[Niche]] = {}
+
         # Find chimeras that could drift toward empty niches
         for c in sanctuary.sanctuary_chimeras:
             if random.random() < 0.1:  # 10% chance
                 # Check if any component has affinity for empty niche
                 for species_name in c.components:
-                    species = sanctuary.species_by_name(species_name)
+                    species = species_index.get(species_name)
                     if species:
-                        for empty_niche in empty_niches:
-                            if empty_niche in species.niche_affinities:
-                                old_niche = c.niche
-                                c.niche = empty_niche
-                                events.append(
-                                    f"Empty niche attraction: {c.id} drifted from {old_niche.value if old_niche else 'none'} to {empty_niche.value}"
-                                )
-                                break
+                        if species_name not in attraction:
+                            attraction[species_name] = next(
+                                (n for n in empty_niches if n in species.niche_affinities), None
+                            )
+                        empty_niche = attraction[species_name]
+                        if empty_niche is not None:
+                            old_niche = c.niche
+                            c.niche = empty_niche
+                            events.append(
+                                f"Empty niche attraction: {c.id} drifted from {old_niche.value if old_niche else 'none'} to {empty_niche.value}"
+                            )
                         break
 
+    if events:
+        sanctuary.invalidate_diversity()
     return events
 
 
@@ -253,8 +278,7 @@ def maybe_speciate(
     # Increase based on drift history
     if chimera.last_drift_ts:
         try:
-            last_drift = datetime.fromisoformat(chimera.last_drift_ts)
-            drift_age = (datetime.now() - last_drift).total_seconds() / 3600
+            drift_age = (time.time() - chimera.last_drift_epoch) / 3600
             if drift_age < 24:  # Recent drift
                 speciation_prob += 0.05
         except ValueError:
@@ -302,6 +326,7 @@ def maybe_speciate(
         new_chimera.niche = random.choice(adjacent)
 
     sanctuary.chimeras.append(new_chimera)
+    sanctuary.invalidate_diversity()
     return new_chimera
 
 
@@ -9,9 +9,11 @@ The threshold is the agential cut. The choice is where meaning happens.
 """
 
 import random
+import time
 from datetime import datetime, timedelta
 from typing import Optional
 
+from .encounter import SECONDS_PER_DAY
 from .types import Chimera, ChimeraState, Niche, Sanctuary
 
 
@@ -100,6 +102,70 @@ NICHE_PHASE_SIGNATURES = {
 }
 
 
+# NICHE_PHASE_SIGNATURES compiled once for detect_threshold: per niche, the
+# numeric criteria present as (metric index, limit, is_max) in the order the
+# score is accumulated, the phase labels as a frozenset (None if absent),
+# and the criterion count. Metric indices follow the values tuple built in
+# detect_threshold.
+_SIGNATURE_METRICS = ("entrainment", "velocity", "curvature", "stability", "coherence")
+
+
+def _compile_signature(signature: dict) -> tuple:
+    bounds = []
+    for key in ("entrainment_min", "velocity_min", "velocity_max", "curvature_min",
+                "stability_min", "stability_max", "coherence_min"):
+        if key in signature:
+            metric, kind = key.rsplit("_", 1)
+            bounds.append((_SIGNATURE_METRICS.index(metric), signature[key], kind == "max"))
+    labels = signature.get("phase_labels")
+    phase_labels = frozenset(labels) if labels is not None else None
+    return tuple(bounds), phase_labels, len(bounds) + (phase_labels is not None)
+
+
+_SIGNATURE_CHECKS = tuple(
+    (niche, *_compile_signature(signature))
+    for niche, signature in NICHE_PHASE_SIGNATURES.items()
+)
+
+
+def _match_niches(
+    entrainment: float,
+    velocity: float,
+    curvature: float,
+    stability: float,
+    coherence: float,
+    phase_label: str
+) -> dict[Niche, float]:
+    """Match score for each niche whose phase signature matches."""
+    match_scores = {}
+    values = (entrainment, velocity, curvature, stability, coherence)
+
+    for niche, bounds, phase_labels, total in _SIGNATURE_CHECKS:
+        score = 0
+        matches = 0
+
+        # Check each criterion
+        for i, limit, is_max in bounds:
+            value = values[i]
+            if is_max:
+                if value <= limit:
+                    matches += 1
+                    score += 1 - value
+            elif value >= limit:
+                matches += 1
+                score += value
+
+        if phase_labels is not None and phase_label in phase_labels:
+            matches += 1
+            score += 1
+
+        # Require at least half of criteria to match
+        if total > 0 and matches >= total / 2:
+            match_scores[niche] = score / total
+
+    return match_scores
+
+
 def detect_threshold(
     phase_dynamics: dict,
     hrv_metrics: dict,
@@ -145,83 +211,23 @@ def detect_threshold(
     phase_label = phase_dynamics.get("phase_label", "")
 
     # Find matching niches based on current phase dynamics
-    matching_niches = []
-    match_scores = {}
-
-    for niche, signature in NICHE_PHASE_SIGNATURES.items():
-        score = 0
-        matches = 0
-        total = 0
-
-        # Check each criterion
-        if "entrainment_min" in signature:
-            total += 1
-            if entrainment >= signature["entrainment_min"]:
-                matches += 1
-                score += entrainment
+    match_scores = _match_niches(entrainment, velocity, curvature, stability, coherence, phase_label)
 
-        if "velocity_min" in signature:
-            total += 1
-            if velocity >= signature["velocity_min"]:
-                matches += 1
-                score += velocity
-
-        if "velocity_max" in signature:
-            total += 1
-            if velocity <= signature["velocity_max"]:
-                matches += 1
-                score += 1 - velocity
-
-        if "curvature_min" in signature:
-            total += 1
-            if curvature >= signature["curvature_min"]:
-                matches += 1
-                score += curvature
-
-        if "stability_min" in signature:
-            total += 1
-            if stability >= signature["stability_min"]:
-                matches += 1
-                score += stability
-
-        if "stability_max" in signature:
-            total += 1
-            if stability <= signature["stability_max"]:
-                matches += 1
-                score += 1 - stability
-
-        if "coherence_min" in signature:
-            total += 1
-            if coherence >= signature["coherence_min"]:
-                matches += 1
-                score += coherence
-
-        if "phase_labels" in signature:
-            total += 1
-            if phase_label in signature["phase_labels"]:
-                matches += 1
-                score += 1
-
-        # Require at least half of criteria to match
-        if total > 0 and matches >= total / 2:
-            matching_niches.append(niche)
-            match_scores[niche] = score / total
-
-    if not matching_niches:
+    if not match_scores:
         return None
 
     # Find chimeras in matching niches
     candidates = []
+    now = time.time()
     for chimera in sanctuary.sanctuary_chimeras:
-        if chimera.niche in matching_niches:
+        if chimera.niche in match_scores:
             # Weight by niche match score and time since last encounter
-            weight = match_scores.get(chimera.niche, 0.5)
+            weight = match_scores[chimera.niche]
 
             # Boost chimeras that haven't been seen recently
             if chimera.last_encountered_ts:
                 try:
-                    last_enc = datetime.fromisoformat(chimera.last_encountered_ts)
-                    days_since = (datetime.now() - last_enc).days
+                    days_since = int((now - chimera.last_encountered_epoch) // SECONDS_PER_DAY)
                     weight += min(days_since * 0.1, 0.5)
                 except ValueError:
                     pass
@@ -235,24 +241,28 @@ def detect_threshold(
         # This is a threshold for a chimera that doesn't exist yet
         return None
 
-    # Probabilistic selection weighted by match score
-    total_weight = sum(w for _, w in candidates)
-    r = random.random() * total_weight
-    cumulative = 0
-
-    for chimera, weight in candidates:
-        cumulative += weight
-        if r <= cumulative:
-            # Update state
-            chimera.state = ChimeraState.THRESHOLD
-            return chimera
+    # Probabilistic selection weighted by match score (random.choices
+    # bisects the cumulative weights)
+    chimeras, weights = zip(*candidates)
+    if sum(weights) > 0:
+        selected = random.choices(chimeras, weights=weights)[0]
+    else:
+        selected = chimeras[0]  # Fallback
 
-    # Fallback
-    selected = candidates[0][0]
+    # Update state
     selected.state = ChimeraState.THRESHOLD
     return selected
 
 
+# Phase labels that always warrant a threshold check
+_TRANSITION_LABELS = frozenset({
+    "inflection (seeking)",
+    "inflection (from entrainment)",
+    "active transition",
+    "settling into entrainment",
+})
+
+
 def should_trigger_threshold(
     phase_dynamics: dict,
     hrv_metrics: dict,
@@ -274,13 +284,7 @@ def should_trigger_threshold(
     """
     # Trigger on phase label transitions
     phase_label = phase_dynamics.get("phase_label", "")
-    transition_labels = [
-        "inflection (seeking)",
-        "inflection (from entrainment)",
-        "active transition",
-        "settling into entrainment"
-    ]
-    if phase_label in transition_labels:
+    if phase_label in _TRANSITION_LABELS:
         return True
 
     # Trigger on curvature spikes
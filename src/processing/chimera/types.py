@@ -74,10 +74,24 @@ class Species:
     encounter_count: int = 0
     witnessed_in_chimeras: list[str] = field(default_factory=list)
 
+    # Membership mirror of witnessed_in_chimeras (not serialized)
+    _witnessed_set: set[str] = field(default_factory=set, init=False, repr=False, compare=False)
+
     @property
     def display_name(self) -> str:
         return self.common_name or self.scientific_name
 
+    def add_witnessed_chimera(self, chimera_id: str) -> None:
+        """Append chimera_id to witnessed_in_chimeras unless already listed."""
+        seen = self._witnessed_set
+        if len(seen) != len(self.witnessed_in_chimeras):
+            # Loaded or edited list: resync the mirror
+            seen.clear()
+            seen.update(self.witnessed_in_chimeras)
+        if chimera_id not in seen:
+            seen.add(chimera_id)
+            self.witnessed_in_chimeras.append(chimera_id)
+
 
 @dataclass
 class Chimera:
@@ -109,10 +123,48 @@ class Chimera:
     drift_rate: float = 1.0  # Higher = faster drift. Decreases with witnessing.
     last_drift_ts: Optional[str] = None
 
+    # last_encountered_ts parsed to epoch seconds, and the string it came from
+    _encountered_epoch: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+    _encountered_src: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    # last_drift_ts likewise
+    _drift_epoch: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+    _drift_src: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
     @property
     def is_witnessed(self) -> bool:
         return self.last_encountered_ts is not None
 
+    @property
+    def last_encountered_epoch(self) -> Optional[float]:
+        """last_encountered_ts as a POSIX timestamp (local time), or None.
+
+        The ISO string stays the stored form; it is parsed once per value
+        rather than on every time comparison. Raises ValueError if the
+        string is not ISO 8601.
+        """
+        ts = self.last_encountered_ts
+        if ts is None:
+            return None
+        if ts is not self._encountered_src:
+            self._encountered_epoch = datetime.fromisoformat(ts).timestamp()
+            self._encountered_src = ts
+        return self._encountered_epoch
+
+    @property
+    def last_drift_epoch(self) -> Optional[float]:
+        """last_drift_ts as a POSIX timestamp (local time), or None.
+
+        Parsed once per value, as for last_encountered_epoch. Raises
+        ValueError if the string is not ISO 8601.
+        """
+        ts = self.last_drift_ts
+        if ts is None:
+            return None
+        if ts is not self._drift_src:
+            self._drift_epoch = datetime.fromisoformat(ts).timestamp()
+            self._drift_src = ts
+        return self._drift_epoch
+
     @property
     def component_names(self) -> list[str]:
         """Return just the species names for display."""
@@ -167,6 +219,35 @@ class Sanctuary:
 
     last_evolution_ts: Optional[str] = None
 
+    # Memoized SanctuaryManager.compute_diversity_index(); None when stale.
+    # Anything that adds chimeras or species, or changes a chimera's niche
+    # or components, must call invalidate_diversity().
+    _diversity_cache: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+
+    # scientific_name -> Species, built on first use (see species_index)
+    _species_index: dict[str, Species] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _species_indexed: int = field(default=-1, init=False, repr=False, compare=False)  # vocabulary size at build
+
+    def invalidate_diversity(self) -> None:
+        """Mark the cached diversity index stale."""
+        self._diversity_cache = None
+
+    @property
+    def species_index(self) -> dict[str, Species]:
+        """Species keyed by scientific name, for O(1) component lookups.
+
+        Rebuilt whenever the vocabulary has grown or shrunk since it was
+        last built; the first species wins on duplicate names, as with
+        species_by_name().
+        """
+        index = self._species_index
+        if self._species_indexed != len(self.species_vocabulary):
+            index.clear()
+            for s in self.species_vocabulary:
+                index.setdefault(s.scientific_name, s)
+            self._species_indexed = len(self.species_vocabulary)
+        return index
+
     @property
     def sanctuary_chimeras(self) -> list[Chimera]:
         """Chimeras currently in sanctuary (unwitnessed or feral)."""
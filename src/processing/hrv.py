@@ -4,7 +4,12 @@ from dataclasses import dataclass
 import math
 
 
-@dataclass
+# Autocorrelation lags scanned for breath-heart coupling. At ~60 BPM, lags 4-8
+# cover ~4-8 beat breath cycles (see compute_phase_coupling).
+BREATH_BAND_LAGS = (4, 5, 6, 7, 8)
+
+
+@dataclass(slots=True)
 class HRVMetrics:
     """Computed HRV metrics from RR interval buffer."""
     # Basic stats
@@ -47,27 +52,45 @@ def compute_amplitude(rr_intervals: list[int]) -> int:
 
 def compute_autocorrelation(rr_intervals: list[int], lag: int) -> float:
     """Compute autocorrelation at specified lag."""
+    return _autocorrelations(rr_intervals, (lag,))[0]
+
+
+def _autocorrelations(rr_intervals: list[int], lags: tuple[int, ...]) -> list[float]:
+    """Autocorrelation at several lags, sharing one mean/variance pass.
+
+    The breath-band scan asks for five lags over the same buffer; computing
+    the mean and variance once per buffer rather than once per lag keeps the
+    per-packet cost to the autocovariance sums alone.
+    """
     n = len(rr_intervals)
-    if n < lag + 2:
-        return 0.0
+    if n < min(lags) + 2:
+        return [0.0] * len(lags)
 
     mean = sum(rr_intervals) / n
 
     # Compute variance
     variance = sum((x - mean) ** 2 for x in rr_intervals) / n
     if variance == 0:
-        return 0.0
+        return [0.0] * len(lags)
 
-    # Compute autocovariance at lag
-    # Use n as denominator (matching variance above) for unbiased normalization.
-    # Using (n - lag) here would inflate the result by n/(n-lag), which at
-    # small buffer sizes (e.g., n=10, lag=8) gives a 5x overestimate.
-    autocovariance = sum(
-        (rr_intervals[i] - mean) * (rr_intervals[i + lag] - mean)
-        for i in range(n - lag)
-    ) / n
+    correlations = []
+    for lag in lags:
+        if n < lag + 2:
+            correlations.append(0.0)
+            continue
 
-    return autocovariance / variance
+        # Compute autocovariance at lag
+        # Use n as denominator (matching variance above) for unbiased normalization.
+        # Using (n - lag) here would inflate the result by n/(n-lag), which at
+        # small buffer sizes (e.g., n=10, lag=8) gives a 5x overestimate.
+        autocovariance = sum(
+            (rr_intervals[i] - mean) * (rr_intervals[i + lag] - mean)
+            for i in range(n - lag)
+        ) / n
+
+        correlations.append(autocovariance / variance)
+
+    return correlations
 
 
 def compute_phase_coupling(rr_intervals: list[int]) -> float:
@@ -97,8 +120,7 @@ def compute_phase_coupling(rr_intervals: list[int]) -> float:
     # At ~60 BPM, breath period of 10s = ~10 beats. Lags 4-8 cover ~4-8 beat
     # breath cycles. (Adaptive lag selection from compute_breath_rate() output
     # is a future improvement — see P3-E in RAA-EBS-001 convergence report.)
-    lags = [4, 5, 6, 7, 8]
-    correlations = [compute_autocorrelation(rr_intervals, lag) for lag in lags]
+    correlations = _autocorrelations(rr_intervals, BREATH_BAND_LAGS)
 
     # Peak autocorrelation indicates rhythmic oscillation; keep its sign.
     max_corr = max(correlations) if correlations else 0.0
@@ -122,11 +144,20 @@ def compute_entrainment(rr_intervals: list[int]) -> tuple[float, str]:
 
     Returns (entrainment_score, label)
     """
-    if len(rr_intervals) < 10:
+    return _entrainment_from_coupling(compute_phase_coupling(rr_intervals), len(rr_intervals))
+
+
+def _entrainment_from_coupling(phase_coupling: float, n: int) -> tuple[float, str]:
+    """Derive (entrainment, label) from an already-computed signed coupling.
+
+    Lets compute_hrv_metrics reuse its phase_coupling rather than scanning the
+    breath-band lags a second time via compute_entrainment.
+    """
+    if n < 10:
         return 0.0, "[insufficient data]"
 
     # Entrainment is locking *strength*: the positive part of signed coupling.
-    entrainment = max(0.0, min(1.0, compute_phase_coupling(rr_intervals)))
+    entrainment = max(0.0, min(1.0, phase_coupling))
 
     # Apply labels
     if entrainment < 0.2:
@@ -311,7 +342,7 @@ def compute_hrv_metrics(rr_intervals: list[int]) -> HRVMetrics:
 
     amplitude = compute_amplitude(rr_intervals)
     phase_coupling = compute_phase_coupling(rr_intervals)
-    entrainment, entrainment_label = compute_entrainment(rr_intervals)
+    entrainment, entrainment_label = _entrainment_from_coupling(phase_coupling, len(rr_intervals))
     breath_rate, breath_steady = compute_breath_rate(rr_intervals)
     volatility = compute_volatility(rr_intervals)
     mode_label, mode_score = compute_mode(amplitude, entrainment, breath_steady, volatility)
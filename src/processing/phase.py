@@ -35,14 +35,14 @@ from .movement import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class PhaseState:
     """A single point in phase space with timestamp."""
     timestamp: float
     position: tuple[float, float, float]  # (entrainment, breath, amplitude)
 
 
-@dataclass
+@dataclass(slots=True)
 class PhaseDynamics:
     """Full dynamics at a moment: position + movement + history."""
     timestamp: float
@@ -130,6 +130,16 @@ class PhaseTrajectory:
         self.cumulative_path_length: float = 0.0
         self._last_velocity: tuple[float, float, float] = (0.0, 0.0, 0.0)
 
+        # Per-step displacement between consecutive states, and its magnitude,
+        # aligned with self.states (one fewer entry). Filled on append so
+        # compute_trajectory_coherence doesn't re-derive the whole window.
+        self._steps: deque[tuple[float, float, float]] = deque(maxlen=max(window_size - 1, 0))
+        self._step_mags: deque[float] = deque(maxlen=max(window_size - 1, 0))
+
+        # Coherence memo, keyed on (append count, lag)
+        self._append_count: int = 0
+        self._coherence_memo: tuple[int, int, float] | None = None
+
         # Movement-preserving classification state (v1.1.0)
         self.mode_history: ModeHistory = ModeHistory()
         self._last_soft_inference: Optional[SoftModeInference] = None
@@ -162,7 +172,12 @@ class PhaseTrajectory:
             step_distance = self._euclidean_distance(prev.position, position)
             self.cumulative_path_length += step_distance
 
+            step = tuple(position[j] - prev.position[j] for j in range(3))
+            self._steps.append(step)
+            self._step_mags.append(self._vector_magnitude(step))
+
         self.states.append(new_state)
+        self._append_count += 1
 
         return dynamics
 
@@ -415,6 +430,9 @@ class PhaseTrajectory:
         self.states.clear()
         self.cumulative_path_length = 0.0
         self._last_velocity = (0.0, 0.0, 0.0)
+        self._steps.clear()
+        self._step_mags.clear()
+        self._coherence_memo = None
         # Reset movement-preserving state (v1.1.0)
         self.mode_history.clear()
         self._last_soft_inference = None
@@ -442,22 +460,28 @@ class PhaseTrajectory:
         if len(self.states) < lag + 3:
             return 0.0  # Insufficient data
 
-        # Extract velocity vectors from recent trajectory
-        # We're asking: does the *pattern of movement* correlate with itself?
-        positions = [s.position for s in self.states]
+        # Unchanged trajectory since the last call → same answer
+        memo = self._coherence_memo
+        if memo is not None and memo[0] == self._append_count and memo[1] == lag:
+            return memo[2]
+
+        coherence = self._trajectory_coherence(lag)
+        self._coherence_memo = (self._append_count, lag, coherence)
+        return coherence
 
-        # Compute velocity sequence (first differences)
-        velocities = []
-        for i in range(1, len(positions)):
-            v = tuple(positions[i][j] - positions[i-1][j] for j in range(3))
-            velocities.append(v)
+    def _trajectory_coherence(self, lag: int) -> float:
+        """Uncached body of compute_trajectory_coherence."""
+        # Velocity vectors (first differences) from recent trajectory, kept
+        # up to date by append(). We're asking: does the *pattern of movement*
+        # correlate with itself?
+        velocities = list(self._steps)
 
         if len(velocities) < lag + 2:
             return 0.0
 
         # Compute autocorrelation of velocity magnitudes
         # This captures: is the *intensity* of movement consistent over time?
-        v_mags = [self._vector_magnitude(v) for v in velocities]
+        v_mags = list(self._step_mags)
 
         n = len(v_mags)
         mean_v = sum(v_mags) / n
@@ -484,8 +508,8 @@ class PhaseTrajectory:
         for i in range(len(velocities) - lag):
             v1 = velocities[i]
             v2 = velocities[i + lag]
-            mag1 = self._vector_magnitude(v1)
-            mag2 = self._vector_magnitude(v2)
+            mag1 = v_mags[i]
+            mag2 = v_mags[i + lag]
             if mag1 > 1e-6 and mag2 > 1e-6:
                 dot = sum(v1[j] * v2[j] for j in range(3))
                 cosine = dot / (mag1 * mag2)
@@ -3,19 +3,32 @@
 Extracted from app.py to isolate the storage layer.
 """
 
-import json
+import atexit
+import heapq
+import time
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 
 from domain.types import SemioticMarker, FieldEvent
 from processing.hrv import HRVMetrics
 from processing.phase import PhaseDynamics
 from processing.schema import SCHEMA_VERSION
+from utils import json_codec
 
 
 class SessionLogger:
     """JSONL timeseries logger for session data."""
 
+    # Encoded records collect in an in-memory buffer and are written in
+    # batches: every FLUSH_EVERY_RECORDS records, FLUSH_BYTES bytes or
+    # FLUSH_INTERVAL_SEC seconds, whichever comes first. At 1Hz that bounds
+    # crash loss to a few seconds of data while avoiding a write syscall per
+    # record. The file itself is unbuffered, so a flush is exactly one write.
+    FLUSH_EVERY_RECORDS = 10
+    FLUSH_BYTES = 4096
+    FLUSH_INTERVAL_SEC = 5.0
+
     def __init__(self, session_dir: str = "sessions"):
         self.session_dir = Path(session_dir)
         self.session_dir.mkdir(exist_ok=True)
@@ -23,12 +36,18 @@ class SessionLogger:
         self.file_handle = None
         self.pending_semiotic: SemioticMarker | None = None
         self.pending_field_event: FieldEvent | None = None
+        self._buffer = bytearray()
+        self._since_flush = 0
+        self._last_flush = 0.0
 
     def start_session(self) -> Path:
         """Start a new session log file."""
         timestamp = datetime.now().strftime("%Y-%m-%d_%H%M%S")
         self.session_file = self.session_dir / f"{timestamp}.jsonl"
-        self.file_handle = open(self.session_file, 'w')
+        self.file_handle = open(self.session_file, 'wb', buffering=0)
+        # Backstop for exit paths that skip close(); buffered records would
+        # otherwise be lost with the process.
+        atexit.register(self.close)
 
         # Write header record with schema version
         header = {
@@ -37,8 +56,8 @@ class SessionLogger:
             "schema_version": SCHEMA_VERSION,
             "note": "ent=entrainment (breath-heart sync), coherence=trajectory integrity"
         }
-        self.file_handle.write(json.dumps(header) + '\n')
-        self.file_handle.flush()
+        self._buffer += json_codec.dumps_line(header)
+        self.flush()
 
         return self.session_file
 
@@ -80,9 +99,13 @@ class SessionLogger:
             }
 
         if dynamics:
-            record["phase"] = {
-                "position": [round(p, 4) for p in dynamics.position],
-                "velocity": [round(v, 4) for v in dynamics.velocity],
+            # Fixed-length vectors: unpack and round per component rather
+            # than building a list comprehension frame per record.
+            px, py, pz = dynamics.position
+            vx, vy, vz = dynamics.velocity
+            record["phase"] = phase = {
+                "position": [round(px, 4), round(py, 4), round(pz, 4)],
+                "velocity": [round(vx, 4), round(vy, 4), round(vz, 4)],
                 "velocity_mag": round(dynamics.velocity_magnitude, 4),
                 "curvature": round(dynamics.curvature, 4),
                 "stability": round(dynamics.stability, 4),
@@ -97,29 +120,29 @@ class SessionLogger:
                 "acceleration_mag": round(dynamics.mode_score_acceleration, 4),
             }
             # Add soft_mode if available (nested object)
-            if dynamics.soft_mode:
-                record["phase"]["soft_mode"] = {
-                    "primary": dynamics.soft_mode.primary_mode,
-                    "secondary": dynamics.soft_mode.secondary_mode,
-                    "ambiguity": round(dynamics.soft_mode.ambiguity, 4),
-                    "distribution_shift": round(dynamics.soft_mode.distribution_shift, 6)
-                        if dynamics.soft_mode.distribution_shift is not None else None,
+            sm = dynamics.soft_mode
+            if sm:
+                phase["soft_mode"] = {
+                    "primary": sm.primary_mode,
+                    "secondary": sm.secondary_mode,
+                    "ambiguity": round(sm.ambiguity, 4),
+                    "distribution_shift": round(sm.distribution_shift, 6)
+                        if sm.distribution_shift is not None else None,
                     # Include top 3 membership weights for debugging/visualization
+                    # (nlargest == sorted(..., reverse=True)[:3], ties included)
                     "membership": {
-                        k: round(v, 4) for k, v in sorted(
-                            dynamics.soft_mode.membership.items(),
-                            key=lambda x: x[1],
-                            reverse=True
-                        )[:3]
+                        k: round(v, 4) for k, v in heapq.nlargest(
+                            3, sm.membership.items(), key=itemgetter(1)
+                        )
                     }
                 }
 
             # Add soft_mode_2d if available (stillness × coherence plane).
             # Additive: only present once coherence is wired into the classifier.
             # Full membership kept — the 2-D set is small (5 modes).
-            if getattr(dynamics, "soft_mode_2d", None):
-                sm2 = dynamics.soft_mode_2d
-                record["phase"]["soft_mode_2d"] = {
+            sm2 = getattr(dynamics, "soft_mode_2d", None)
+            if sm2:
+                phase["soft_mode_2d"] = {
                     "primary": sm2.primary_mode,
                     "secondary": sm2.secondary_mode,
                     "ambiguity": round(sm2.ambiguity, 4),
@@ -128,7 +151,7 @@ class SessionLogger:
                     "membership": {
                         k: round(v, 4) for k, v in sorted(
                             sm2.membership.items(),
-                            key=lambda x: x[1],
+                            key=itemgetter(1),
                             reverse=True
                         )
                     }
@@ -152,8 +175,21 @@ class SessionLogger:
             }
             self.pending_field_event = None  # Clear after logging
 
-        self.file_handle.write(json.dumps(record) + '\n')
-        self.file_handle.flush()
+        self._buffer += json_codec.dumps_line(record)
+        self._since_flush += 1
+        if (self._since_flush >= self.FLUSH_EVERY_RECORDS
+                or len(self._buffer) >= self.FLUSH_BYTES
+                or time.monotonic() - self._last_flush >= self.FLUSH_INTERVAL_SEC):
+            self.flush()
+
+    def flush(self):
+        """Write buffered records to disk."""
+        buf = self._buffer
+        if self.file_handle:
+            while buf:  # raw writes may be partial
+                del buf[:self.file_handle.write(buf)]
+        self._since_flush = 0
+        self._last_flush = time.monotonic()
 
     def add_semiotic_marker(self, marker: SemioticMarker):
         """Store semiotic marker from Semantic Climate for next log entry."""
@@ -164,7 +200,9 @@ class SessionLogger:
         self.pending_field_event = event
 
     def close(self):
-        """Close the session file."""
+        """Close the session file (flushing any buffered records)."""
         if self.file_handle:
+            self.flush()
             self.file_handle.close()
             self.file_handle = None
+            atexit.unregister(self.close)
@@ -0,0 +1,48 @@
+"""JSON encode/decode for session records and wire messages.
+
+Uses orjson when it is installed and falls back to the stdlib json module
+otherwise. Both paths emit the same compact layout (no whitespace after
+separators, UTF-8 rather than \\u escapes). Two differences remain:
+
+- Exponent floats may be spelled differently (1e-05 vs 1e-5), which every
+  JSON reader parses alike.
+- Non-finite floats (NaN, +/-Infinity): orjson writes null, the stdlib
+  writes the non-standard NaN / Infinity tokens. Both paths' loads() read
+  their own output back (as None and as the float respectively), but
+  strict readers such as JavaScript's JSON.parse reject the stdlib
+  spelling. Callers that can produce non-finite values should map them
+  to None themselves rather than rely on either path.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional accelerator — see requirements.txt
+    orjson = None
+
+
+def dumps(obj: Any) -> str:
+    """Serialize obj to a compact JSON string."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+def dumps_line(obj: Any) -> bytes:
+    """Serialize obj to one UTF-8 JSONL line (trailing newline included)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, separators=(",", ":"), ensure_ascii=False) + "\n").encode()
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse a JSON document from str or bytes.
+
+    Raises json.JSONDecodeError on malformed input on both paths
+    (orjson.JSONDecodeError subclasses it).
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
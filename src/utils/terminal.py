@@ -0,0 +1,38 @@
+"""Terminal painting shared by the single- and dual-strap console UIs."""
+
+import sys
+
+
+# Erase display + home cursor
+CLEAR_SCREEN = '\033[2J\033[H'
+
+
+class RowRenderer:
+    """Paints frames, rewriting only the rows that changed since the last one.
+
+    The first frame, or one whose height differs from the last (e.g. a
+    window that grows during warm-up), is a full clear-and-paint. After
+    that, each changed row is overwritten in place via cursor positioning,
+    and the whole update goes out as one write + flush. An identical frame
+    writes nothing.
+    """
+
+    def __init__(self):
+        self._last: list[str] | None = None  # rows last painted
+
+    def render(self, lines: list[str]):
+        prev = self._last
+        if lines == prev:
+            return  # nothing changed: no write, no flush
+        if prev is None or len(prev) != len(lines):
+            out = [CLEAR_SCREEN, '\n'.join(lines), '\n']
+        else:
+            out = [
+                f'\033[{row};1H\033[2K{line}'
+                for row, (line, old) in enumerate(zip(lines, prev), start=1)
+                if line != old
+            ]
+            out.append(f'\033[{len(lines) + 1};1H')  # park cursor below the frame
+        sys.stdout.write(''.join(out))
+        sys.stdout.flush()
+        self._last = lines
@@ -97,6 +97,16 @@ class TestDeviceLookup:
         device = registry.get_device_by_label("Z")
         assert device is None
 
+    def test_label_lookup_follows_reload(self, registry, sample_config):
+        """Reloading an edited config reindexes labels."""
+        config = json.loads(sample_config.read_text())
+        config["devices"]["10E74932"]["label"] = "C"
+        sample_config.write_text(json.dumps(config))
+
+        assert registry.load() is True
+        assert registry.get_device_by_label("B") is None
+        assert registry.get_device_by_label("C").serial == "10E74932"
+
 
 class TestSerialExtraction:
     """Tests for serial extraction from device names."""
@@ -248,6 +248,12 @@ class TestComputeHRVMetrics:
         assert -1.0 <= m.phase_coupling <= 1.0
         assert m.entrainment == max(0.0, m.phase_coupling)
 
+    def test_pipeline_entrainment_matches_standalone(self, rr_with_oscillation, rr_noisy):
+        """The pipeline reuses phase_coupling; result must equal compute_entrainment."""
+        for rr in (rr_with_oscillation, rr_noisy, _anti_phase_rr(), [1000] * 8):
+            m = compute_hrv_metrics(rr)
+            assert (m.entrainment, m.entrainment_label) == compute_entrainment(rr)
+
     def test_anti_phase_pipeline_preserves_sign(self):
         """At the wall, entrainment is 0 but phase_coupling retains the negative signal."""
         m = compute_hrv_metrics(_anti_phase_rr())
@@ -0,0 +1,95 @@
+"""Tests for the JSON codec shared by session logs and the WebSocket API.
+
+Covers src/utils/json_codec.py — both the orjson path and the stdlib
+fallback must produce the same layout, so sessions don't depend on which
+one a capture host happened to have installed.
+"""
+
+import json
+import math
+import pytest
+
+from src.utils import json_codec
+
+
+RECORD = {
+    "ts": "2026-05-25T20:00:00",
+    "hr": 64,
+    "rr": [1000, 987, 1012],
+    "metrics": {"ent": 0.412, "breath": None, "mode": "settling"},
+    "phase": {"position": [0.2, 0.5, 0.4], "coherence": 1e-05},
+}
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def codec(request, monkeypatch):
+    if request.param == "stdlib":
+        monkeypatch.setattr(json_codec, "orjson", None)
+    elif json_codec.orjson is None:
+        pytest.skip("orjson not installed")
+    return json_codec
+
+
+class TestDumps:
+
+    def test_returns_str(self, codec):
+        assert isinstance(codec.dumps(RECORD), str)
+
+    def test_compact_separators(self, codec):
+        assert codec.dumps({"a": 1, "b": [1, 2]}) == '{"a":1,"b":[1,2]}'
+
+    def test_roundtrip_matches_stdlib(self, codec):
+        assert json.loads(codec.dumps(RECORD)) == RECORD
+
+    def test_non_ascii_unescaped(self, codec):
+        assert codec.dumps({"label": "●"}) == '{"label":"●"}'
+
+
+class TestDumpsLine:
+
+    def test_bytes_line_matches_dumps(self, codec):
+        line = codec.dumps_line(RECORD)
+        assert isinstance(line, bytes)
+        assert line == (codec.dumps(RECORD) + "\n").encode()
+
+
+class TestLoads:
+
+    def test_accepts_str_and_bytes(self, codec):
+        text = json.dumps(RECORD)
+        assert codec.loads(text) == RECORD
+        assert codec.loads(text.encode()) == RECORD
+
+    def test_malformed_raises_stdlib_error(self, codec):
+        with pytest.raises(json.JSONDecodeError):
+            codec.loads("{not json")
+
+
+def test_paths_agree(monkeypatch):
+    if json_codec.orjson is None:
+        pytest.skip("orjson not installed")
+    record = {k: v for k, v in RECORD.items() if k != "phase"}  # no exponent floats
+    fast = json_codec.dumps(record)
+    monkeypatch.setattr(json_codec, "orjson", None)
+    assert json_codec.dumps(record) == fast
+
+
+class TestNonFinite:
+    """NaN/Infinity are where the two paths differ (see the module docstring)."""
+
+    def test_orjson_writes_null(self):
+        if json_codec.orjson is None:
+            pytest.skip("orjson not installed")
+        out = json_codec.dumps({"ent": float("nan"), "amp": float("inf")})
+        assert out == '{"ent":null,"amp":null}'
+        assert json_codec.loads(out) == {"ent": None, "amp": None}
+
+    def test_stdlib_writes_nan_token(self, monkeypatch):
+        monkeypatch.setattr(json_codec, "orjson", None)
+        out = json_codec.dumps({"ent": float("nan"), "amp": float("inf")})
+        assert out == '{"ent":NaN,"amp":Infinity}'
+        back = json_codec.loads(out)
+        assert math.isnan(back["ent"]) and back["amp"] == math.inf
+
+    def test_none_is_null_on_both_paths(self, codec):
+        assert codec.dumps({"breath": None}) == '{"breath":null}'
@@ -137,6 +137,12 @@ class TestParseHeartRateMeasurement:
         # No contact support -> defaults to True
         assert result.sensor_contact is True
 
+    def test_truncated_fields_do_not_raise(self):
+        """Short 16-bit HR reads the bytes present; an odd trailing RR byte is dropped."""
+        assert parse_heart_rate_measurement(bytearray([0x01, 0x48])).heart_rate == 72
+        packet = bytearray([0x10, 60, 0x00, 0x04, 0x07])  # RR raw 1024 + stray byte
+        assert parse_heart_rate_measurement(packet).rr_intervals == [1000]
+
 
 # Resolved at import; tests that need it skip cleanly when no fixture is present.
 _PMD_ACC_FIXTURES = sorted(
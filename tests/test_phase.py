@@ -112,6 +112,34 @@ class TestTrajectoryCoherence:
         coherence = traj.compute_trajectory_coherence()
         assert 0.0 <= coherence <= 1.0
 
+    def test_cached_steps_track_rolling_window(
+        self, metrics_calm, metrics_alert, metrics_transitional
+    ):
+        """Steps cached on append match first differences of the live window,
+        including after the window starts dropping old states."""
+        traj = PhaseTrajectory(window_size=10)
+        cycle = (metrics_calm, metrics_alert, metrics_transitional, metrics_calm)
+        for t in range(25):
+            traj.append(cycle[t % len(cycle)], timestamp=float(t))
+            positions = [s.position for s in traj.states]
+            expected = [
+                tuple(positions[i][j] - positions[i - 1][j] for j in range(3))
+                for i in range(1, len(positions))
+            ]
+            assert list(traj._steps) == expected
+
+    def test_recomputed_after_append(self, metrics_calm, metrics_alert):
+        """Repeated calls are memoized, but a new state invalidates the result."""
+        traj = PhaseTrajectory()
+        for t in range(12):
+            traj.append(metrics_calm, timestamp=float(t))
+        still = traj.compute_trajectory_coherence()
+        assert traj.compute_trajectory_coherence() == still
+        for t in range(12, 20):
+            m = metrics_calm if t % 2 == 0 else metrics_alert
+            traj.append(m, timestamp=float(t))
+        assert traj.compute_trajectory_coherence() != still
+
 
 # =============================================================================
 # History Signature
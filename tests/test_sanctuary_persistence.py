@@ -0,0 +1,139 @@
+"""Tests for sanctuary persistence.
+
+Covers SanctuaryManager in src/processing/chimera/ecology.py — the JSON
+round-trip (orjson and stdlib paths), skipping unchanged saves, the
+write-then-rename save, and the binary snapshot.
+"""
+
+import json
+
+import pytest
+
+from src.processing.chimera import ecology
+from src.processing.chimera.ecology import SanctuaryManager
+from src.processing.chimera.types import (
+    Chimera,
+    ChimeraState,
+    Country,
+    Encounter,
+    Niche,
+    Sanctuary,
+    Species,
+)
+
+
+def _sanctuary():
+    species = [
+        Species(
+            scientific_name="Vulpes vulpes",
+            common_name="Fox",
+            taxon_group="fauna",
+            family="Canidae",
+            niche_affinities=[Niche.GRIP_PREDATOR, Niche.FLOW_SCANNING],
+        ),
+        Species(
+            scientific_name="Eucalyptus haemastoma",
+            common_name="Scribbly Gum",
+            taxon_group="flora",
+            family="Myrtaceae",
+            qualities=["rooted"],
+            niche_affinities=[Niche.SETTLING_ROOTED],
+        ),
+    ]
+    chimeras = [
+        Chimera(
+            id="chimera_a",
+            components=["Vulpes vulpes", "Eucalyptus haemastoma"],
+            weights=[0.6, 0.4],
+            niche=Niche.GRIP_PREDATOR,
+        ),
+        Chimera(
+            id="chimera_b",
+            components=["Eucalyptus haemastoma"],
+            weights=[1.0],
+            lineage=["chimera_a"],
+            niche=Niche.SETTLING_ROOTED,
+            state=ChimeraState.ENCOUNTERED,
+            last_encountered_ts="2026-01-01T09:00:00",
+            encounter_count=1,
+        ),
+    ]
+    encounter = Encounter(
+        ts="2026-01-01T09:00:00",
+        chimera_id="chimera_b",
+        witnessed=True,
+        phase_context={"phase_label": "coherent dwelling", "position": [0.1, 0.8, 0.2]},
+    )
+    return Sanctuary(
+        country=Country(name="Test Country", bioregion="Test Basin", acknowledgment="-"),
+        species_vocabulary=species,
+        chimeras=chimeras,
+        encounter_history=[encounter],
+        threshold_history=[encounter],
+    )
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def codec(request, monkeypatch):
+    if request.param == "stdlib":
+        monkeypatch.setattr(ecology, "orjson", None)
+    elif ecology.orjson is None:
+        pytest.skip("orjson not installed")
+    return request.param
+
+
+def test_json_round_trip(tmp_path, codec):
+    path = tmp_path / "sanctuary.json"
+    original = _sanctuary()
+    SanctuaryManager(original).save(path)
+
+    loaded = SanctuaryManager.load(path).sanctuary
+    assert loaded == original
+
+    data = json.loads(path.read_text())
+    assert data["chimeras"][0]["niche"] == "grip/predator"
+    assert data["ecology_metrics"]["total_chimeras"] == 2
+
+
+def test_unchanged_save_does_not_rewrite(tmp_path, monkeypatch):
+    path = tmp_path / "sanctuary.json"
+    manager = SanctuaryManager(_sanctuary())
+    manager.save(path)
+    mtime = path.stat().st_mtime_ns
+
+    replaced = []
+    real_replace = ecology.os.replace
+    monkeypatch.setattr(ecology.os, "replace", lambda *a: replaced.append(a) or real_replace(*a))
+    manager.save(path)
+    assert path.stat().st_mtime_ns == mtime
+    assert replaced == []
+
+
+def test_mutation_rewrites_without_leaving_tmp(tmp_path):
+    path = tmp_path / "sanctuary.json"
+    manager = SanctuaryManager(_sanctuary())
+    manager.save(path)
+
+    manager.sanctuary.chimeras[0].niche = Niche.FLOW_SCANNING
+    manager.sanctuary.invalidate_diversity()
+    manager.save(path)
+
+    assert json.loads(path.read_text())["chimeras"][0]["niche"] == "flow/scanning"
+    assert [p.name for p in tmp_path.iterdir()] == ["sanctuary.json"]
+
+
+def test_binary_snapshot_round_trip(tmp_path):
+    path = tmp_path / "sanctuary.pkl"
+    original = _sanctuary()
+    SanctuaryManager(original).save_binary(path)
+
+    assert SanctuaryManager.load_binary(path).sanctuary == original
+
+
+def test_load_binary_rejects_other_pickles(tmp_path):
+    import pickle
+
+    path = tmp_path / "other.pkl"
+    path.write_bytes(pickle.dumps({"not": "a sanctuary"}))
+    with pytest.raises(TypeError):
+        SanctuaryManager.load_binary(path)
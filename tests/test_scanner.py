@@ -0,0 +1,90 @@
+"""Tests for the H10 scan's passive-to-active fallback.
+
+Covers src/ble/scanner.py scan_for_polar_h10 against a fake BleakScanner:
+each scanning mode advertises a fixed set of straps.
+"""
+
+import asyncio
+
+import pytest
+from bleak.exc import BleakError
+
+from src.ble import scanner
+
+
+class FakeDevice:
+    def __init__(self, name, address):
+        self.name = name
+        self.address = address
+
+
+STRAP_A = FakeDevice("Polar H10 A1B2C3D4", "AA")
+STRAP_B = FakeDevice("Polar H10 E5F6A7B8", "BB")
+
+
+class FakeScanner:
+    """Advertises seen[mode] shortly after start(); records modes started."""
+
+    seen: dict[str, list] = {}
+    passive_supported = True
+    modes: list[str] = []
+
+    def __init__(self, detection_callback=None, service_uuids=None,
+                 scanning_mode="active", bluez=None):
+        if scanning_mode == "passive" and not self.passive_supported:
+            raise BleakError("passive scanning not supported")
+        self._callback = detection_callback
+        self._mode = scanning_mode
+        self._task = None
+
+    async def start(self):
+        FakeScanner.modes.append(self._mode)
+
+        async def advertise():
+            for device in FakeScanner.seen.get(self._mode, []):
+                await asyncio.sleep(0.005)
+                self._callback(device, None)
+
+        self._task = asyncio.create_task(advertise())
+
+    async def stop(self):
+        self._task.cancel()
+
+
+@pytest.fixture
+def fake_scanner(monkeypatch):
+    monkeypatch.setattr(scanner, "BleakScanner", FakeScanner)
+    monkeypatch.setattr(scanner, "ACTIVE_FALLBACK_SEC", 0.05)
+    FakeScanner.modes = []
+    FakeScanner.passive_supported = True
+    return FakeScanner
+
+
+def _scan(**kwargs):
+    devices = asyncio.run(scanner.scan_for_polar_h10(**kwargs))
+    return sorted(d.address for d in devices)
+
+
+def test_passive_finds_all_expected(fake_scanner):
+    fake_scanner.seen = {"passive": [STRAP_A, STRAP_B]}
+    assert _scan(timeout=1.0, expected=2) == ["AA", "BB"]
+    assert fake_scanner.modes == ["passive"]
+
+
+def test_falls_back_to_active_when_passive_sees_nothing(fake_scanner):
+    fake_scanner.seen = {"passive": [], "active": [STRAP_A, STRAP_B]}
+    assert _scan(timeout=1.0, expected=2) == ["AA", "BB"]
+    assert fake_scanner.modes == ["passive", "active"]
+
+
+def test_falls_back_to_active_when_passive_sees_one_of_two(fake_scanner):
+    fake_scanner.seen = {"passive": [STRAP_A], "active": [STRAP_A, STRAP_B]}
+    assert _scan(timeout=1.0, expected=2) == ["AA", "BB"]
+    assert fake_scanner.modes == ["passive", "active"]
+
+
+def test_active_straight_away_without_passive_mode(fake_scanner):
+    fake_scanner.passive_supported = False
+    fake_scanner.seen = {"active": [STRAP_A]}
+    assert _scan(timeout=1.0, expected=1) == ["AA"]
+    assert fake_scanner.modes == ["active"]
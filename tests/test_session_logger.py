@@ -0,0 +1,76 @@
+"""Tests for the JSONL session logger.
+
+Covers src/storage/session_logger.py — header/record layout and the batched
+flush policy (records reach disk in bounded batches, and always on close).
+"""
+
+import json
+from datetime import datetime
+
+from storage.session_logger import SessionLogger
+
+
+def _read(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_header_on_disk_immediately(tmp_path):
+    logger = SessionLogger(session_dir=str(tmp_path))
+    path = logger.start_session()
+    records = _read(path)
+    assert records[0]["type"] == "session_start"
+    logger.close()
+
+
+def test_records_batched_until_threshold(tmp_path, metrics_calm):
+    logger = SessionLogger(session_dir=str(tmp_path))
+    logger.FLUSH_INTERVAL_SEC = 3600.0  # isolate the count bound
+    logger.FLUSH_BYTES = 1 << 20
+    path = logger.start_session()
+
+    for _ in range(logger.FLUSH_EVERY_RECORDS - 1):
+        logger.log(datetime(2026, 1, 1), 60, [1000], metrics_calm)
+    assert len(_read(path)) == 1  # header only, records still buffered
+
+    logger.log(datetime(2026, 1, 1), 60, [1000], metrics_calm)
+    assert len(_read(path)) == 1 + logger.FLUSH_EVERY_RECORDS
+    logger.close()
+
+
+def test_close_flushes_remaining_records(tmp_path, metrics_calm):
+    logger = SessionLogger(session_dir=str(tmp_path))
+    logger.FLUSH_INTERVAL_SEC = 3600.0
+    path = logger.start_session()
+    logger.log(datetime(2026, 1, 1), 60, [1000, 990], metrics_calm)
+    logger.close()
+
+    records = _read(path)
+    assert len(records) == 2
+    assert records[1]["rr"] == [1000, 990]
+    assert records[1]["metrics"]["mode"] == "settled presence"
+
+
+def test_close_is_registered_at_exit(tmp_path, monkeypatch):
+    import atexit
+
+    registered = []
+    monkeypatch.setattr(atexit, "register", registered.append)
+    monkeypatch.setattr(atexit, "unregister", registered.remove)
+
+    logger = SessionLogger(session_dir=str(tmp_path))
+    logger.start_session()
+    assert registered == [logger.close]
+    logger.close()
+    assert registered == []
+
+
+def test_byte_bound_flushes_early(tmp_path, metrics_calm):
+    logger = SessionLogger(session_dir=str(tmp_path))
+    logger.FLUSH_INTERVAL_SEC = 3600.0
+    logger.FLUSH_EVERY_RECORDS = 1000
+    logger.FLUSH_BYTES = 1  # any record crosses it
+    path = logger.start_session()
+
+    logger.log(datetime(2026, 1, 1), 60, [1000], metrics_calm)
+    assert len(_read(path)) == 2
+    logger.close()
@@ -58,3 +58,104 @@ def test_existing_fields_unchanged():
     ):
         assert key in msg
     assert msg["type"] == "phase"
+
+
+class _RecordingClient:
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, payload):
+        self.sent.append(payload)
+
+
+def test_broadcast_serializes_once_for_all_clients(monkeypatch):
+    import asyncio
+    import json
+    from api import websocket_server
+
+    calls = []
+    real_dumps = websocket_server.json_codec.dumps
+
+    def counting_dumps(obj):
+        calls.append(obj)
+        return real_dumps(obj)
+
+    monkeypatch.setattr(websocket_server.json_codec, "dumps", counting_dumps)
+    server = WebSocketServer()
+    clients = [_RecordingClient() for _ in range(3)]
+
+    async def run():
+        for c in clients:
+            server._register(c)
+        await server.broadcast_session_end(duration_sec=60, samples=60)
+        await server.stop()  # drains queued frames
+
+    asyncio.run(run())
+
+    assert len(calls) == 1
+    payloads = [c.sent[0] for c in clients]
+    assert all(p is payloads[0] for p in payloads)
+    assert json.loads(payloads[0])["type"] == "session_end"
+
+
+class _StalledClient(_RecordingClient):
+    def __init__(self):
+        super().__init__()
+        self.gate = None
+
+    async def send(self, payload):
+        await self.gate.wait()
+        self.sent.append(payload)
+
+
+def test_slow_client_drops_oldest_frames():
+    import asyncio
+    import json
+
+    server = WebSocketServer()
+    fast, slow = _RecordingClient(), _StalledClient()
+    total = server.CLIENT_QUEUE_SIZE + 5
+
+    async def run():
+        slow.gate = asyncio.Event()
+        server._register(fast)
+        server._register(slow)
+        for i in range(total):
+            await server.broadcast_session_end(duration_sec=i, samples=i)
+            await asyncio.sleep(0)  # let writers run between broadcasts
+        slow.gate.set()
+        await server.stop()
+
+    asyncio.run(run())
+
+    durations = lambda c: [json.loads(p)["duration_sec"] for p in c.sent]
+    assert durations(fast) == list(range(total))
+    # The stalled writer holds one frame in flight; its queue kept the newest
+    assert durations(slow)[-server.CLIENT_QUEUE_SIZE:] == list(
+        range(total - server.CLIENT_QUEUE_SIZE, total)
+    )
+    assert len(slow.sent) < total
+    assert server.clients == {}
+
+
+def test_broadcast_phase_queues_without_awaiting():
+    import asyncio
+    import json
+
+    server = WebSocketServer()
+    client = _RecordingClient()
+
+    async def run():
+        server._register(client)
+        result = server.broadcast_phase(
+            timestamp=datetime(2026, 5, 25, 20, 0, 0), hr=64,
+            position=(0.2, 0.5, 0.4), velocity=(0.01, 0.0, 0.0),
+            velocity_mag=0.05, curvature=0.3, stability=0.7,
+            entrainment=0.2, phase_label="settling",
+        )
+        assert result is None  # plain call, no coroutine to schedule
+        await server.stop()
+
+    asyncio.run(run())
+    assert json.loads(client.sent[0])["hr"] == 64
+